@@ -14,25 +14,32 @@ from __future__ import annotations
 
 # Standard library imports.
 import atexit
+import bisect
 import fnmatch
+import functools
+import hashlib
 import json
+import operator
 import os
 import posixpath
+import re
 import shutil
 import stat
 import subprocess
 import sys
 import tempfile
 import threading
+import time
 import tkinter as tk
 import tkinter.font as tkfont
 import shlex
 
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from queue import Queue
-from typing import Optional, Iterator, cast, Union
+from queue import Empty, Queue
+from typing import Callable, Iterable, Optional, Iterator, cast, Union
 from tkinter import filedialog, messagebox, ttk
 
 from libs.g_button import GButton
@@ -50,12 +57,66 @@ from scp import SCPClient
 CONFIG_FILE = "g_synchro.json"
 HISTORY_LENGTH = 10
 CHUNK_SIZE = 4096
+SCAN_BUFFER_SIZE = 65536
+REMOTE_PIPE_CHUNK_SIZE = 1 << 20
+SYNC_TRANSFER_WORKERS = 4
+REMOTE_SCRIPT_ARGS = 500
+REMOTE_LISTDIR_TTL = 60.0
+REMOTE_SCAN_TTL = 10.0
+REMOTE_PRELOAD_DEPTH = 3
+REMOTE_PRELOAD_MAX_LINES = 50000
+PROGRESS_POLL_MS = 50
+HASH_CHUNK_SIZE = 1 << 20
+TEXT_WIDTH_CACHE_SIZE = 100000
+# Remote bulk hash command; reads NUL-separated paths from stdin.
+REMOTE_HASH_COMMAND = "xargs -0 sha256sum 2>/dev/null"
+# Comparison stats counter for each file status.
+STATUS_STATS_KEYS = {
+    "Identical": "identical",
+    "Different": "different",
+    "Conflict": "conflicts",
+    "Only in A": "only_a",
+    "Only in B": "only_b",
+}
+# Remote scan commands per stat flavor; {path} is the quoted remote folder.
+# GNU find prints the fields itself, with a one-letter type ("d" for folders),
+# so no stat process is spawned per entry. BusyBox stat lacks a reliable file
+# type field, so the type is resolved by a small shell loop on the remote
+# side, batching many entries per exec.
+REMOTE_FIND_COMMANDS = {
+    "GNU find": "find {path} -mindepth 1 -printf '%p|%y|%s|%T@\\n' 2>/dev/null",
+    "GNU": "find {path} -mindepth 1 -exec stat -c '%n|%F|%s|%Y' {{}} \\; 2>/dev/null",
+    "BusyBox": (
+        "find {path} -mindepth 1 -exec"
+        ' sh -c \'for p; do if [ -d "$p" ]; then t=directory;'
+        ' else t="regular file"; fi;'
+        ' stat -c "%n|$t|%s|%Y" "$p"; done\' _ {{}} + 2>/dev/null'
+    ),
+    "BSD": (
+        "find {path} -mindepth 1 -exec stat -f '%N|%HT|%z|%m' {{}} \\; 2>/dev/null"
+    ),
+}
 CHECKED_CHAR = "✓"
 UNCHECKED_CHAR = "☐"
+# Check mark per state, indexed by a bool.
+_CHECK_CHARS = (UNCHECKED_CHAR, CHECKED_CHAR)
 MIN_WINDOW_WIDTH = 1024
 MIN_WINDOW_HEIGHT = 768
 DEFAULT_FONT_FAMILY = "Courier New"
 DEFAULT_FONT_SIZE = 11
+# Paths inside a tmp/temp folder or the system temporary directory.
+TEMP_PATH_RE = re.compile(r"/te?mp/|\\te?mp\\|" + re.escape(tempfile.gettempdir()))
+# Font family names taken to be monospace (simplified check).
+MONO_FONT_RE = re.compile("mono|consolas|courier|fixedsys|terminal", re.IGNORECASE)
+# Path named in a find error line, such as "find: '/x': Permission denied".
+FIND_ERROR_PATH_RE = re.compile(r"^[^:]*: ['\"‘]?(.*?)['\"’]?: [^:]*$")
+# Shared (status_text, color) results, reused for every item.
+STATUS_IDENTICAL = ("Identical", "green")
+STATUS_DIFFERENT = ("Different", "orange")
+STATUS_DIFFERENT_FOLDER = ("Different", "magenta")
+STATUS_CONFLICT = ("Conflict", "black")
+STATUS_ONLY_A = ("Only in A", "blue")
+STATUS_ONLY_B = ("Only in B", "red")
 
 
 # ============================================================================
@@ -76,6 +137,79 @@ def _posix_join(*parts: str) -> str:
     return posixpath.join(*parts)
 
 
+def _iter_channel_lines(
+    channel: paramiko.Channel, chunk_size: int = SCAN_BUFFER_SIZE
+) -> Iterator[str]:
+    """Yield decoded output lines from an SSH channel as chunks arrive.
+
+    Paramiko's transport thread keeps receiving into the channel buffer
+    while lines are consumed, and each chunk is split in one call instead
+    of line by line.
+    """
+    pending = b""
+    while True:
+        chunk = channel.recv(chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+# Sort key of filter rule dictionaries.
+_rule_key = operator.itemgetter("rule")
+
+
+def _filters_fingerprint(filters: list) -> tuple:
+    """Return a cheap, comparable snapshot of filter rules and their states."""
+    return tuple((item["rule"], bool(item["active"])) for item in filters)
+
+
+# ============================================================================
+# HELPER UTILITIES (for Tcl scripts)
+# ============================================================================
+
+_TCL_ESCAPES = {"\n": "\\n", "\t": "\\t", "\r": "\\r"}
+_TCL_SPECIAL_RE = re.compile(r'[\\{}\[\]$";\s]')
+
+
+def _tcl_quote(value: str) -> str:
+    """Return `value` as a single Tcl word, for building tk.eval scripts.
+
+    Every character Tcl would interpret is backslash-escaped, so any file
+    name or filter rule comes through unchanged.
+    """
+    if not value:
+        return "{}"
+    return _TCL_SPECIAL_RE.sub(
+        lambda match: _TCL_ESCAPES.get(match.group(), "\\" + match.group()), value
+    )
+
+
+# ============================================================================
+# HELPER UTILITIES (for display formatting)
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_size_cached(size_bytes: Union[int, float]) -> str:
+    """Format a file size to be readable; results are memoized."""
+    for unit in [" B", "KB", "MB", "GB", "TB"]:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} PB"  # Beyond TB, it's Petabytes
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_time_cached(seconds: int) -> str:
+    """Format a whole-second timestamp to a date string; results are memoized."""
+    return datetime.fromtimestamp(seconds).strftime("%Y-%m-%d %H:%M:%S")
+
+
 # ============================================================================
 # CONNECTION MANAGER CLASS
 # ============================================================================
@@ -175,10 +309,14 @@ class ConnectionManager:
             if server_key not in self._pools:
                 self._initialize_pool(server_key, host, user, password, port)
 
-        # Get connection from pool.
+        # Get connection from pool. When every pooled connection is in use,
+        # open another one rather than wait for one to come back.
         conn = None
         try:
-            conn = self._pools[server_key].get(timeout=10)
+            try:
+                conn = self._pools[server_key].get_nowait()
+            except Empty:
+                conn = self._create_connection(host, user, password, port)
 
             # Check if connection is still alive.
             transport = conn.get_transport() if conn else None
@@ -199,7 +337,10 @@ class ConnectionManager:
                 try:
                     # Check if connection is still good before returning.
                     transport = conn.get_transport()
-                    if transport and transport.is_active():
+                    if self._pools[server_key].qsize() >= self.pool_size:
+                        # The pool is full again: drop the extra connection.
+                        conn.close()
+                    elif transport and transport.is_active():
                         self._pools[server_key].put(conn, timeout=1)
                     else:
                         conn.close()
@@ -270,6 +411,9 @@ class Comparer:
         use_ssh_b: bool,
         ssh_client_a: Optional[paramiko.SSHClient],
         ssh_client_b: Optional[paramiko.SSHClient],
+        sftp_a: Optional[paramiko.SFTPClient] = None,
+        sftp_b: Optional[paramiko.SFTPClient] = None,
+        trust_mtime: bool = False,
     ) -> tuple:
         """Compare two files and return status.
 
@@ -280,20 +424,70 @@ class Comparer:
             use_ssh_b: Whether Panel B uses SSH
             ssh_client_a: The SSH client for panel A
             ssh_client_b: The SSH client for panel B
+            sftp_a: Open SFTP session for panel A, reused instead of a new one
+            sftp_b: Open SFTP session for panel B, reused instead of a new one
+            trust_mtime: Treat files with equal size and modification time
+                (to the second) as identical without reading them
 
         Returns:
             Tuple of (status_text, color)
         """
+        status = self._compare_metadata(file_a, file_b, trust_mtime)
+        if status is not None:
+            return status
+
+        try:
+            with (
+                self._open_file_handle(
+                    file_a, use_ssh_a, ssh_client_a, sftp_a
+                ) as file_a_handle,
+                self._open_file_handle(
+                    file_b, use_ssh_b, ssh_client_b, sftp_b
+                ) as file_b_handle,
+            ):
+                if not self._are_chunks_identical(file_a_handle, file_b_handle):
+                    return STATUS_DIFFERENT
+
+            return STATUS_IDENTICAL
+
+        except Exception as e:
+            self.log(f"Error during chunked file comparison: {e}")
+            return STATUS_DIFFERENT
+
+    def _compare_metadata(
+        self,
+        file_a: Optional[dict],
+        file_b: Optional[dict],
+        trust_mtime: bool = False,
+    ) -> Optional[tuple]:
+        """Compare two files using only their scanned metadata.
+
+        Args:
+            file_a: File info from Panel A
+            file_b: File info from Panel B
+            trust_mtime: Treat files with equal size and modification time
+                (to the second) as identical without reading them
+
+        Returns:
+            Tuple of (status_text, color), or None if the contents must be
+            read to decide
+        """
         if file_a and file_b:
             is_a_file = file_a.get("type") == "file"
             is_b_file = file_b.get("type") == "file"
 
             if is_a_file and not is_b_file:
-                return "Conflict", "black"
+                return STATUS_CONFLICT
             if not is_a_file and is_b_file:
-                return "Conflict", "black"
+                return STATUS_CONFLICT
             if file_a.get("size") != file_b.get("size"):
-                return "Different", "orange"
+                return STATUS_DIFFERENT
+            if (
+                trust_mtime
+                and is_a_file
+                and int(file_a.get("modified", -1)) == int(file_b.get("modified", -2))
+            ):
+                return STATUS_IDENTICAL
 
             if (
                 isinstance(file_a, dict)
@@ -301,31 +495,15 @@ class Comparer:
                 and isinstance(file_b, dict)
                 and "size" in file_b
             ):
-                try:
-                    with (
-                        self._open_file_handle(
-                            file_a, use_ssh_a, ssh_client_a
-                        ) as file_a_handle,
-                        self._open_file_handle(
-                            file_b, use_ssh_b, ssh_client_b
-                        ) as file_b_handle,
-                    ):
-                        if not self._are_chunks_identical(file_a_handle, file_b_handle):
-                            return "Different", "orange"
-
-                    return "Identical", "green"
+                return None
 
-                except Exception as e:
-                    self.log(f"Error during chunked file comparison: {e}")
-                    return "Different", "orange"
-            else:
-                # Fallback for items that exist in both but aren't comparable as
-                # files.
-                return "Different", "orange"
+            # Fallback for items that exist in both but aren't comparable as
+            # files.
+            return STATUS_DIFFERENT
         elif file_a:
-            return "Only in A", "blue"
+            return STATUS_ONLY_A
         else:
-            return "Only in B", "red"
+            return STATUS_ONLY_B
 
     @contextmanager
     def _open_file_handle(
@@ -333,6 +511,7 @@ class Comparer:
         file_info: dict,
         use_ssh: bool,
         ssh_client: Optional[paramiko.SSHClient],
+        sftp: Optional[paramiko.SFTPClient] = None,
     ) -> Iterator:
         """A context manager to open a file handle, local or remote.
 
@@ -340,6 +519,7 @@ class Comparer:
             file_info: File information dictionary
             use_ssh: Whether to use SSH
             ssh_client: SSH client for remote access
+            sftp: Open SFTP session to use; left open on exit
 
         Yields:
             File handle object
@@ -347,7 +527,10 @@ class Comparer:
         Raises:
             ConnectionError: If SSH client is not connected
         """
-        if use_ssh:
+        if use_ssh and sftp:
+            with sftp.open(file_info["full_path"], "rb") as file_handle:
+                yield file_handle
+        elif use_ssh:
             if not ssh_client:
                 raise ConnectionError("SSH client is not connected.")
             transport = ssh_client.get_transport()
@@ -364,6 +547,113 @@ class Comparer:
             with open(file_info["full_path"], "rb") as file_handle:
                 yield file_handle
 
+    def _hash_files(
+        self,
+        rel_paths: list,
+        files: dict,
+        use_ssh: bool,
+        ssh_config: dict,
+        max_workers: int = 4,
+    ) -> dict:
+        """Compute the SHA-256 digest of many files of one panel.
+
+        Remote files are hashed on the host by a single command, so their
+        contents never cross the network. Files that could not be hashed are
+        missing from the result.
+
+        Args:
+            rel_paths: Relative paths of the files to hash
+            files: Scanned files of the panel
+            use_ssh: Whether the panel uses SSH
+            ssh_config: SSH configuration for the panel
+            max_workers: Maximum number of parallel workers for local files
+
+        Returns:
+            Dictionary mapping relative paths to hex digests
+        """
+        full_paths = {files[rel_path]["full_path"]: rel_path for rel_path in rel_paths}
+
+        if use_ssh:
+            try:
+                with self.connection_manager.get_connection(**ssh_config) as ssh_client:
+                    digests = self._hash_remote_files(ssh_client, list(full_paths))
+            except Exception as e:
+                self.log(f"Remote hashing failed: {e}")
+                return {}
+        else:
+
+            def hash_local(full_path: str) -> tuple:
+                try:
+                    return full_path, self._hash_local_file(full_path)
+                except OSError:
+                    return full_path, None
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                digests = dict(executor.map(hash_local, full_paths))
+
+        return {
+            full_paths[full_path]: digest
+            for full_path, digest in digests.items()
+            if digest and full_path in full_paths
+        }
+
+    def _hash_remote_files(
+        self, ssh_client: paramiko.SSHClient, full_paths: list
+    ) -> dict:
+        """Hash remote files with one sha256sum run fed through xargs.
+
+        Args:
+            ssh_client: SSH client of the host
+            full_paths: Absolute remote paths of the files
+
+        Returns:
+            Dictionary mapping remote paths to hex digests
+        """
+        stdin, stdout, stderr = ssh_client.exec_command(
+            REMOTE_HASH_COMMAND, bufsize=SCAN_BUFFER_SIZE
+        )
+
+        # Feed the path list from another thread: sha256sum starts printing
+        # before the list is complete, and the output must be drained
+        # meanwhile or both channel windows fill up.
+        def feed_paths():
+            try:
+                stdin.write("\0".join(full_paths))
+            finally:
+                stdin.channel.shutdown_write()
+
+        feeder = threading.Thread(target=feed_paths, daemon=True)
+        feeder.start()
+
+        digests = {}
+        for line in _iter_channel_lines(stdout.channel):
+            # Names with special characters are escaped by sha256sum and
+            # marked with a leading backslash; leave those to the fallback.
+            digest, sep, full_path = line.partition("  ")
+            if sep and not digest.startswith("\\"):
+                digests[full_path] = digest
+        feeder.join()
+        stdout.channel.recv_exit_status()
+        return digests
+
+    def _hash_local_file(self, full_path: str) -> str:
+        """Compute the SHA-256 digest of a local file.
+
+        Args:
+            full_path: Path of the file
+
+        Returns:
+            Hex digest
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        digest = hashlib.sha256()
+        with open(full_path, "rb") as file_handle:
+            while chunk := file_handle.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     def _are_chunks_identical(self, file_a_handle, file_b_handle) -> bool:
         """Compare two file handles chunk by chunk.
 
@@ -434,6 +724,18 @@ class GSynchro:
         self.files_a = {}
         self.files_b = {}
         self.filter_rules = []
+        self._active_filters_cache: Optional[list[str]] = None
+        # (folder_a, folder_b, rules) of the last filter apply the trees show.
+        self._last_apply_fingerprint: Optional[tuple] = None
+        self._cached_mono_fonts: Optional[list[str]] = None
+        # Font used to measure column contents: {(family, size): font}.
+        self._measure_fonts: dict[tuple, tkfont.Font] = {}
+        # Hidden label keeping the measuring font in use by a widget.
+        self._measure_font_label: Optional[tk.Label] = None
+        # Pixel width of texts measured with the current font: {text: width}.
+        self._text_widths: dict[str, int] = {}
+        # Trees with a column width adjustment scheduled.
+        self._column_widths_pending: set[str] = set()
         self.temp_files_to_clean = []
 
         # Options for fonts.
@@ -452,6 +754,8 @@ class GSynchro:
         # Status Variables.
         self._context_menu_tree: Optional[ttk.Treeview] = None
         self._context_menu_item_id: Optional[str] = None
+        # Last state set for each tree context menu entry, by label.
+        self._context_menu_states: dict[str, str] = {}
 
         self.status_a = tk.StringVar()
         self.status_b = tk.StringVar()
@@ -459,7 +763,44 @@ class GSynchro:
         # Threading lock for progress bar updates.
         self._progress_lock = threading.Lock()
 
+        # Progress steps counted by worker threads, applied by the Tk loop.
+        self._progress_pending = 0
+        self._progress_poll_id: Optional[str] = None
+
+        # Pending post-sync comparison, shared by back-to-back syncs.
+        self._compare_after_id: Optional[str] = None
+
+        # Remote listing caches: {key: (timestamp, result)}.
+        self._remote_listdir_cache: dict[tuple[str, str], tuple[float, list]] = {}
+        self._remote_scan_cache: dict[tuple, tuple[float, dict]] = {}
+
+        # Remote stat flavor per SSH endpoint: {host key: flavor}.
+        self._stat_flavor_cache: dict[str, str] = {}
+
+        # Remote login directory per SSH endpoint: {host key: path}.
+        self._ssh_pwd_cache: dict[str, str] = {}
+
+        # Relative path of every item, recorded at insert time:
+        # {tree: {iid: rel_path}}. Trees are only filled by
+        # _batch_populate_tree, so the index covers every item.
+        self._tree_item_paths: dict[str, dict[str, str]] = {}
+
+        # Compiled filter rules: {rules: (path_re, dir_re, name_re)}.
+        self._compiled_rules_cache: dict[
+            tuple, tuple[re.Pattern, re.Pattern, re.Pattern]
+        ] = {}
+
+        # Hash of the last configuration written to (or read from) disk.
+        self._last_config_hash: Optional[int] = None
+
         self.colors = get_theme_colors()
+
+        # Button factories bound to the theme's colors for each style.
+        buttons = self.colors["buttons"]
+        self._primary_btn = functools.partial(GButton, **buttons["primary"])
+        self._default_btn = functools.partial(GButton, **buttons["default"])
+        self._secondary_btn = functools.partial(GButton, **buttons["secondary"])
+
         self._load_config()
         self._init_window()
         self._setup_ui()
@@ -488,6 +829,7 @@ class GSynchro:
         try:
             with open(CONFIG_FILE, "r") as f:
                 config = json.load(f)
+            self._last_config_hash = hash(json.dumps(config, sort_keys=True))
 
             # Window geometry.
             if "WINDOW" in config and "geometry" in config["WINDOW"]:
@@ -542,8 +884,101 @@ class GSynchro:
                 processed_rules.append(item)
             else:
                 self._log(f"Warning: Invalid filter rule format: {item}. Skipping.")
-        processed_rules.sort(key=lambda item: item["rule"])
-        self.filter_rules = processed_rules
+        processed_rules.sort(key=_rule_key)
+        self._set_filter_rules(processed_rules)
+
+    def _apply_filters(self, active_rules: list):
+        """Rescan both panels with the given rules, then compare them.
+
+        Nothing is rescanned when the trees already show these rules for the
+        same folders.
+
+        Args:
+            active_rules: Filter rules to apply
+        """
+        # What the trees would show. Each panel's SSH endpoint counts too:
+        # the same path on another host, or as another user, is another tree.
+        fingerprint = (
+            self.folder_a.get(),
+            self.folder_b.get(),
+            self._has_ssh_a()
+            and (
+                self.remote_host_a.get(),
+                self.remote_user_a.get(),
+                self.remote_port_a.get(),
+            ),
+            self._has_ssh_b()
+            and (
+                self.remote_host_b.get(),
+                self.remote_user_b.get(),
+                self.remote_port_b.get(),
+            ),
+            tuple(sorted(active_rules)),
+        )
+        if fingerprint == self._last_apply_fingerprint:
+            self._log("Filters unchanged, skipping rescan")
+            return
+        self._log(f"Applying active filters: {active_rules}")
+
+        # Compile the rules here so both scan threads hit the cache.
+        self._compile_rules(active_rules)
+
+        # Clear file lists and trees.
+        self.files_a.clear()
+        self.files_b.clear()
+        self._update_status("A", self.files_a)
+        self._update_status("B", self.files_b)
+        if self.tree_a:
+            self._batch_populate_tree(self.tree_a, {})
+        if self.tree_b:
+            self._batch_populate_tree(self.tree_b, {})
+
+        # Compare once every panel scan has reported back, without a
+        # thread waiting on the scans.
+        folders = [
+            (panel, folder)
+            for panel, folder in (
+                ("A", self.folder_a.get()),
+                ("B", self.folder_b.get()),
+            )
+            if folder
+        ]
+        pending_scans = [len(folders)]
+        scans_ok = [True]
+
+        def on_compared():
+            # The trees now show these rules; a repeat Apply can be skipped.
+            if scans_ok[0]:
+                self._last_apply_fingerprint = fingerprint
+
+        def on_scan_done(succeeded: bool):
+            pending_scans[0] -= 1
+            scans_ok[0] = scans_ok[0] and succeeded
+            if pending_scans[0] == 0:
+                self.compare_folders(
+                    use_scan_cache=True, active_rules=active_rules, on_done=on_compared
+                )
+
+        if not folders:
+            self.root.after(0, self.compare_folders)
+        for panel, folder in folders:
+            self._populate_single_panel(
+                panel,
+                folder,
+                active_rules=active_rules,
+                on_done=on_scan_done,
+                use_scan_cache=True,
+            )
+
+    def _set_filter_rules(self, rules: list):
+        """Replace the filter rules and drop the cached active rules.
+
+        Args:
+            rules: Filter rule dictionaries, sorted by rule
+        """
+        self.filter_rules = rules
+        self._active_filters_cache = None
+        self._last_apply_fingerprint = None
 
     def _save_config(self):
         """Save configuration to file."""
@@ -577,8 +1012,6 @@ class GSynchro:
             self.remote_user_b.get(),
         )
 
-        self.filter_rules.sort(key=lambda item: item["rule"])
-
         config = {
             "WINDOW": {"geometry": self.root.geometry()},
             "SSH_A": {
@@ -599,8 +1032,14 @@ class GSynchro:
             "FOLDER_B_HISTORY": self.folder_b_history,
         }
 
+        # Skip the write when nothing changed since the last save.
+        config_hash = hash(json.dumps(config, sort_keys=True))
+        if config_hash == self._last_config_hash:
+            return
+
         with open(CONFIG_FILE, "w") as f:
             json.dump(config, f, indent=4)
+        self._last_config_hash = config_hash
 
     # ==========================================================================
     # UI CREATION METHODS
@@ -788,7 +1227,6 @@ class GSynchro:
         panel.rowconfigure(4, weight=1)
 
         # SSH settings widgets.
-        ttk.Frame(panel)
         ttk.Label(panel, text="Host:").grid(
             row=0, column=0, padx=5, pady=5, sticky=tk.E
         )
@@ -904,26 +1342,33 @@ class GSynchro:
             show="tree headings",
         )
 
-        # Configure columns.
-        tree.heading("#0", text="Name")
-        tree.column("#0", width=200, anchor="w", stretch=True)
-
-        tree.heading("sync", text="Sync")
-        tree.column("sync", width=50, anchor="center", stretch=False)
-
-        tree.heading("size", text="Size")
-        tree.column("size", width=80, anchor="e", stretch=False)
-
-        tree.heading("modified", text="Modified")
-        tree.column("modified", width=120, anchor="center", stretch=False)
-
-        tree.heading("status", text="Status")
-        tree.column("status", width=100, anchor="center", stretch=False)
+        # Configure columns in a single Tcl call: (column, heading, width,
+        # anchor, stretch).
+        columns_config = [
+            ("#0", "Name", 200, "w", True),
+            ("sync", "Sync", 50, "center", False),
+            ("size", "Size", 80, "e", False),
+            ("modified", "Modified", 120, "center", False),
+            ("status", "Status", 100, "center", False),
+        ]
+        tree.tk.eval(
+            "\n".join(
+                f"{tree} heading {column} -text {{{text}}}\n"
+                f"{tree} column {column} -width {width} -anchor {anchor}"
+                f" -stretch {int(stretch)}"
+                for column, text, width, anchor, stretch in columns_config
+            )
+        )
 
-        # Configure tags for different status colors.
+        # Configure tags for different status colors in a single Tcl call. Font
+        # is applied later.
         colors = self.colors["status"]
-        for tag, color in colors.items():
-            tree.tag_configure(tag, foreground=color)  # Font is applied later.
+        tree.tk.eval(
+            "\n".join(
+                f"{tree} tag configure {tag} -foreground {color}"
+                for tag, color in colors.items()
+            )
+        )
 
         return tree
 
@@ -1209,6 +1654,43 @@ class GSynchro:
             self.hosts_b.insert(0, entry)
             self.hosts_b = self.hosts_b[:HISTORY_LENGTH]
 
+    def _ssh_host_key(self, ssh_client: paramiko.SSHClient) -> str:
+        """Return an identity for the remote endpoint of an SSH client.
+
+        Args:
+            ssh_client: SSH client to identify
+
+        Returns:
+            Key string in the form "user@host:port"
+        """
+        transport = ssh_client.get_transport()
+        if transport is None:
+            return str(id(ssh_client))
+        host, port = transport.getpeername()[:2]
+        return f"{transport.get_username()}@{host}:{port}"
+
+    def _ssh_pwd(self, ssh_client: paramiko.SSHClient) -> str:
+        """Return the remote login directory, querying it once per endpoint.
+
+        Args:
+            ssh_client: SSH client to use
+
+        Returns:
+            Remote working directory of a new session
+        """
+        host_key = self._ssh_host_key(ssh_client)
+        remote_path = self._ssh_pwd_cache.get(host_key)
+        if remote_path is None:
+            stdin, stdout, stderr = ssh_client.exec_command("pwd")
+            remote_path = stdout.read().decode().strip()
+            self._ssh_pwd_cache[host_key] = remote_path
+        return remote_path
+
+    def _invalidate_remote_caches(self):
+        """Drop all cached remote listings and scans."""
+        self._remote_listdir_cache.clear()
+        self._remote_scan_cache.clear()
+
     # ==========================================================================
     # REMOTE PANEL BROWSING METHODS
     # ==========================================================================
@@ -1234,8 +1716,7 @@ class GSynchro:
                     )
 
                 current_path = initial_path or folder_var.get()
-                stdin, stdout, stderr = ssh_client.exec_command("pwd")
-                remote_path = stdout.read().decode().strip()
+                remote_path = self._ssh_pwd(ssh_client)
 
                 if not current_path or not current_path.startswith(remote_path):
                     current_path = remote_path
@@ -1254,6 +1735,98 @@ class GSynchro:
             )
             return None
 
+    def _ssh_listdir(self, ssh_client: paramiko.SSHClient, path: str) -> list:
+        """List the sub-folders of a remote path, using a short-lived cache.
+
+        Args:
+            ssh_client: SSH client to use
+            path: Remote path to list
+
+        Returns:
+            List of sub-folder names
+
+        Raises:
+            Exception: If the remote command reports an error
+        """
+        key = (self._ssh_host_key(ssh_client), path)
+        cached = self._remote_listdir_cache.get(key)
+        if cached and time.monotonic() - cached[0] < REMOTE_LISTDIR_TTL:
+            return cached[1]
+
+        # Use a more portable find command without -printf for BusyBox
+        # compatibility. Quote the remote path for safety.
+        command = f"find {_posix_quote(path)} -maxdepth 1 -mindepth 1 -type d"
+        stdin, stdout, stderr = ssh_client.exec_command(command)
+        error = stderr.read().decode().strip()
+        if error:
+            raise Exception(error)
+
+        dir_names = [line.strip().split("/")[-1] for line in stdout if line.strip()]
+        self._remote_listdir_cache[key] = (time.monotonic(), dir_names)
+        return dir_names
+
+    def _ssh_preload_tree(
+        self,
+        ssh_client: paramiko.SSHClient,
+        root: str,
+        depth: int = REMOTE_PRELOAD_DEPTH,
+    ):
+        """Prefetch several levels of remote sub-folders with a single command.
+
+        Every folder whose children are fully known is stored in the listing
+        cache, so that descending into it needs no further round trip. Folders
+        find could not read are left out, and nothing is stored when the root
+        itself fails.
+
+        Args:
+            ssh_client: SSH client to use
+            root: Remote path to start from
+            depth: Number of folder levels to fetch
+        """
+        root = root.rstrip("/") or "/"
+        root_prefix = root.rstrip("/") + "/"
+        command = f"find {_posix_quote(root)} -maxdepth {depth} -mindepth 1 -type d"
+        stdin, stdout, stderr = ssh_client.exec_command(
+            command, bufsize=SCAN_BUFFER_SIZE
+        )
+        # Errors come interleaved with the listing, so a flood of them can
+        # never stall the channel while only stdout is read.
+        stdout.channel.set_combine_stderr(True)
+
+        children: dict[str, list] = {}
+        failed_paths = set()
+        for count, dir_path in enumerate(_iter_channel_lines(stdout.channel)):
+            if count >= REMOTE_PRELOAD_MAX_LINES:
+                # Pathological tree: leave it to per-folder listings.
+                stdout.channel.close()
+                return
+            if not dir_path:
+                continue
+            if not dir_path.startswith(root_prefix):
+                # An error line; the folder it names is not fully listed.
+                match = FIND_ERROR_PATH_RE.match(dir_path)
+                failed_paths.add(match.group(1).rstrip("/") if match else root)
+                continue
+            parent, name = posixpath.split(dir_path)
+            children.setdefault(parent, []).append(name)
+            # Folders above the deepest level have all their children listed.
+            if dir_path.count("/") - root.rstrip("/").count("/") < depth:
+                children.setdefault(dir_path, [])
+
+        # A failure not pinned on a sub-folder, such as a missing root, is
+        # left for _ssh_listdir to report.
+        if stdout.channel.recv_exit_status() != 0 and (
+            root in failed_paths or not failed_paths
+        ):
+            return
+        children.setdefault(root, [])
+
+        host_key = self._ssh_host_key(ssh_client)
+        now = time.monotonic()
+        for parent, dir_names in children.items():
+            if parent not in failed_paths:
+                self._remote_listdir_cache[(host_key, parent)] = (now, dir_names)
+
     def _show_remote_dialog(
         self,
         ssh_client: paramiko.SSHClient,
@@ -1295,15 +1868,26 @@ class GSynchro:
         path_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
         def go_to_path(event=None):
-            load_folders(path_var.get())
+            load_folders(path_var.get(), preload=True)
 
-        GButton(
+        def refresh_path():
+            path = path_var.get()
+            self._remote_listdir_cache.pop((self._ssh_host_key(ssh_client), path), None)
+            load_folders(path)
+
+        self._default_btn(
             path_frame,
             text="Go",
             command=go_to_path,
             width=70,
             height=30,
-            **self.colors["buttons"]["default"],
+        ).pack(side=tk.LEFT, padx=(5, 0))
+        self._default_btn(
+            path_frame,
+            text="Refresh",
+            command=refresh_path,
+            width=70,
+            height=30,
         ).pack(side=tk.LEFT, padx=(5, 0))
         path_entry.bind("<Return>", go_to_path)
 
@@ -1319,33 +1903,61 @@ class GSynchro:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        def load_folders(path: str):
-            """Load folders from remote path.
+        # Listings run in a worker thread; only the latest request is shown.
+        load_state = {"request": 0, "loading": False}
+
+        def load_folders(path: str, preload: bool = False):
+            """Load folders from remote path without blocking the dialog.
 
             Args:
                 path: Remote path to load
+                preload: Whether to prefetch the folder levels below path
             """
-            try:
-                listbox.delete(0, tk.END)
-                path_var.set(path)
-
-                if path != "/":
-                    listbox.insert(tk.END, "..")
-
-                # Use a more portable find command without -printf for BusyBox
-                # compatibility. Quote the remote path for safety.
-                command = f"find {_posix_quote(path)} -maxdepth 1 -mindepth 1 -type d"  # noqa: E501
-                stdin, stdout, stderr = ssh_client.exec_command(command)
-                error = stderr.read().decode().strip()
-                if error:
-                    raise Exception(error)
-
-                for line in stdout:
-                    full_dir_path = line.strip()
-                    dir_name = full_dir_path.split("/")[-1]
-                    listbox.insert(tk.END, dir_name)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load folders: {str(e)}")
+            load_state["request"] += 1
+            load_state["loading"] = True
+            request_id = load_state["request"]
+
+            listbox.delete(0, tk.END)
+            listbox.insert(tk.END, "Loading...")
+            path_var.set(path)
+
+            def load_thread_func():
+                try:
+                    if preload:
+                        self._ssh_preload_tree(ssh_client, path)
+                    dir_names = self._ssh_listdir(ssh_client, path)
+                    error = None
+                except Exception as e:
+                    dir_names, error = [], e
+                self.root.after(0, show_folders, request_id, path, dir_names, error)
+
+            threading.Thread(target=load_thread_func, daemon=True).start()
+
+        def show_folders(
+            request_id: int, path: str, dir_names: list, error: Optional[Exception]
+        ):
+            """Show a finished listing unless a newer one was requested.
+
+            Args:
+                request_id: Request number of the listing
+                path: Remote path that was listed
+                dir_names: Sub-folder names
+                error: Error raised while listing, if any
+            """
+            if request_id != load_state["request"] or not dialog.winfo_exists():
+                return
+
+            load_state["loading"] = False
+            listbox.delete(0, tk.END)
+            if error is not None:
+                messagebox.showerror("Error", f"Failed to load folders: {str(error)}")
+                return
+
+            if path != "/":
+                listbox.insert(tk.END, "..")
+
+            for dir_name in dir_names:
+                listbox.insert(tk.END, dir_name)
 
         def on_select(event: tk.Event):
             """Handle folder selection.
@@ -1354,11 +1966,11 @@ class GSynchro:
                 event: Tkinter event
             """
             selection = listbox.curselection()
-            if selection:
+            if selection and not load_state["loading"]:
                 selected = listbox.get(selection[0])
                 if selected == "..":
                     parent_path = "/".join(path_var.get().split("/")[:-1]) or "/"
-                    load_folders(parent_path)
+                    load_folders(parent_path, preload=True)
                 else:
                     new_path = path_var.get().rstrip("/") + "/" + selected
                     load_folders(new_path)
@@ -1379,27 +1991,25 @@ class GSynchro:
         button_container = ttk.Frame(button_frame)
         button_container.pack()
 
-        GButton(
+        self._default_btn(
             button_container,
             text="Cancel",
             command=on_cancel,
             width=100,
             height=34,
-            **self.colors["buttons"]["default"],
         ).pack(side=tk.LEFT, padx=5)
 
-        GButton(
+        self._primary_btn(
             button_container,
             text="Select",
             command=on_select_folder,
             width=100,
             height=34,
-            **self.colors["buttons"]["primary"],
         ).pack(side=tk.LEFT, padx=5)
 
         # Bind events and initial actions.
         listbox.bind("<Double-Button-1>", on_select)
-        load_folders(current_path)
+        load_folders(current_path, preload=True)
 
         # Center dialog and wait.
         self._center_dialog(dialog)
@@ -1417,6 +2027,8 @@ class GSynchro:
         folder_path: str,
         ssh_client: Optional[paramiko.SSHClient] = None,
         active_rules: Optional[list] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+        use_scan_cache: bool = False,
     ) -> threading.Thread:
         """Populate single panel tree view.
 
@@ -1425,12 +2037,18 @@ class GSynchro:
             folder_path: Path to scan
             ssh_client: Optional SSH client for remote scanning
             active_rules: Optional filter rules to apply
+            on_done: Optional callback run on the main thread once the scan
+                has finished, called with whether it succeeded
+            use_scan_cache: Whether a recent remote scan may be reused
 
         Returns:
             Thread object that performs the scanning
         """
+        # The panel no longer shows the result of the last filter apply.
+        self._last_apply_fingerprint = None
 
         def populate_thread_func():
+            succeeded = False
             try:
                 self.root.after(0, self._start_progress, panel)
 
@@ -1443,12 +2061,12 @@ class GSynchro:
                 )
 
                 files = self._scan_folder(
-                    folder_path, use_ssh, ssh_client, panel, rules
+                    folder_path, use_ssh, ssh_client, panel, rules, use_scan_cache
                 )
 
                 target_files_dict = self.files_a if panel == "A" else self.files_b
                 target_files_dict.update(files)
-                self.root.after(0, lambda: self._update_status(panel, files))
+                self._update_status(panel, files)
 
                 # Update tree view.
                 tree_structure = self._build_tree_structure(files)
@@ -1457,9 +2075,10 @@ class GSynchro:
                 def populate_and_adjust():
                     if tree:
                         self._batch_populate_tree(tree, tree_structure, rules)
-                        self._adjust_tree_column_widths(tree)
+                        self._schedule_column_widths(tree)
 
                 self.root.after(0, populate_and_adjust)
+                succeeded = True
 
             except Exception as e:
                 self._log(f"Error populating panel {panel}: {str(e)}")
@@ -1468,11 +2087,46 @@ class GSynchro:
                 )
             finally:
                 self.root.after(0, self._stop_progress)
+                if on_done is not None:
+                    self.root.after(0, on_done, succeeded)
 
         thread = threading.Thread(target=populate_thread_func, daemon=True)
         thread.start()
         return thread
 
+    def _compile_rules(self, rules: list) -> tuple[re.Pattern, re.Pattern, re.Pattern]:
+        """Compile filter rules into combined regular expressions.
+
+        Args:
+            rules: Filter rules (fnmatch patterns)
+
+        Returns:
+            Tuple of (path_re, dir_re, name_re): path_re matches a relative
+            path against every rule, dir_re matches a relative folder path
+            with a trailing "/" against the folder rules, and name_re matches
+            a single name against the rules without a trailing "/"
+        """
+        key = tuple(rules)
+        compiled = self._compiled_rules_cache.get(key)
+        if compiled is not None:
+            return compiled
+
+        # Mirror fnmatch.fnmatch, which ignores case where the OS does.
+        flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+        def combine(patterns: list) -> re.Pattern:
+            if not patterns:
+                return re.compile(r"(?!)")
+            return re.compile("|".join(fnmatch.translate(p) for p in patterns), flags)
+
+        compiled = (
+            combine(rules),
+            combine([r for r in rules if r.endswith("/")]),
+            combine([r for r in rules if not r.endswith("/")]),
+        )
+        self._compiled_rules_cache[key] = compiled
+        return compiled
+
     def _scan_folder(
         self,
         folder_path: str,
@@ -1480,6 +2134,7 @@ class GSynchro:
         ssh_client: Optional[paramiko.SSHClient],
         panel_name: str,
         rules: Optional[list] = None,
+        use_cache: bool = False,
     ) -> dict:
         """Scan folder (local or remote).
 
@@ -1489,6 +2144,7 @@ class GSynchro:
             ssh_client: SSH client for remote scanning
             panel_name: Panel identifier
             rules: Filter rules to apply
+            use_cache: Whether a recent remote scan may be reused
 
         Returns:
             Dictionary of scanned files
@@ -1500,7 +2156,7 @@ class GSynchro:
             self._log(f"SSH scan panel {panel_name}")
             # If an ssh_client is not provided, get one from the pool.
             if ssh_client:
-                return self._scan_remote(folder_path, ssh_client, rules)
+                return self._scan_remote(folder_path, ssh_client, rules, use_cache)
             else:
                 try:
                     with self._create_ssh_for_panel(panel_name) as new_ssh_client:
@@ -1509,7 +2165,9 @@ class GSynchro:
                                 f"Failed to acquire SSH client for panel {panel_name}"
                             )
                             return {}
-                        files = self._scan_remote(folder_path, new_ssh_client, rules)
+                        files = self._scan_remote(
+                            folder_path, new_ssh_client, rules, use_cache
+                        )
                         num_dirs = sum(
                             1 for f in files.values() if f.get("type") == "dir"
                         )
@@ -1543,79 +2201,164 @@ class GSynchro:
         Returns:
             Dictionary of scanned files
         """
-        files = {}
         if rules is None:
             rules = []
 
+        files = {}
         try:
-            for root, dirs, filenames in os.walk(
-                folder_path, topdown=True, followlinks=True
-            ):
-                excluded_dirs = set()
-                for d in dirs:
-                    dir_rel_path = os.path.relpath(os.path.join(root, d), folder_path)
-                    for pattern in rules:
-                        if pattern.endswith("/") and fnmatch.fnmatch(
-                            dir_rel_path.replace(os.sep, "/") + "/", pattern
-                        ):
-                            excluded_dirs.add(d)
-                        elif fnmatch.fnmatch(
-                            dir_rel_path.replace(os.sep, "/"), pattern
-                        ):
-                            excluded_dirs.add(d)
-                        elif not pattern.endswith("/") and fnmatch.fnmatch(d, pattern):
-                            excluded_dirs.add(d)
-
-                dirs[:] = [d for d in dirs if d not in excluded_dirs]
-
-                # Add directories.
-                for dirname in dirs:
-                    full_path = os.path.join(root, dirname)
-                    rel_path = os.path.relpath(full_path, folder_path)
-                    if dirname not in excluded_dirs:
-                        files[rel_path] = {
-                            "type": "dir",
-                            "full_path": full_path,
-                        }
-
-                # Add files.
-                for filename in filenames:
-                    full_path = os.path.join(root, filename)
-                    rel_path = os.path.relpath(full_path, folder_path)
-
-                    if any(
-                        fnmatch.fnmatch(rel_path.replace(os.sep, "/"), r) for r in rules
-                    ):
-                        continue
-
-                    try:
-                        stat_info = os.stat(full_path)
-                        files[rel_path] = {
-                            "size": stat_info.st_size,
-                            "modified": stat_info.st_mtime,
-                            "full_path": full_path,
-                            "type": "file",
-                        }
-                    except OSError as e:
-                        self._log(f"Error accessing {full_path}: {str(e)}")
+            # Top-level entries are listed here; each top-level folder is then
+            # walked in its own thread, as filesystem calls release the GIL.
+            files = self._scan_local_scandir(
+                os.fspath(folder_path), rules, recursive=False
+            )
+            top_dirs = [
+                (info["full_path"], rel_path)
+                for rel_path, info in files.items()
+                if info["type"] == "dir"
+            ]
+            if top_dirs:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(top_dirs), os.cpu_count() or 4)
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._scan_local_scandir, dir_path, rules, rel_path
+                        )
+                        for dir_path, rel_path in top_dirs
+                    ]
+                    for future in as_completed(futures):
+                        files.update(future.result())
         except Exception as e:
             self._log(f"Error scanning folder {folder_path}: {str(e)}")
 
         self._log(f"Local folder scan ended for {folder_path}")
         return files
 
-    def _scan_remote(
-        self,
-        folder_path: str,
-        ssh_client: paramiko.SSHClient,
-        rules: Optional[list] = None,
+    def _scan_local_scandir(
+        self, root: str, rules: list, rel_root: str = "", recursive: bool = True
     ) -> dict:
-        """Scan remote folder using SSH.
+        """Walk a local folder with os.scandir, following folder symlinks.
+
+        Each entry is stat'ed at most once, and only after it has passed the
+        filter rules.
 
         Args:
-            folder_path: Remote path to scan
-            ssh_client: SSH client to use
+            root: Path to scan
             rules: Filter rules to apply
+            rel_root: Relative path of root within the scanned panel folder
+            recursive: Whether to descend into sub-folders
+
+        Returns:
+            Dictionary of scanned files
+
+        Raises:
+            OSError: If the root folder cannot be read
+        """
+        path_re, dir_re, name_re = self._compile_rules(rules)
+        files = {}
+
+        # Stack of (folder path, relative path of the folder).
+        stack = [(root, rel_root)]
+        while stack:
+            dir_path, dir_rel = stack.pop()
+            try:
+                it = os.scandir(dir_path)
+            except OSError as e:
+                if dir_path == root and not rel_root:
+                    raise
+                self._log(f"Error accessing {dir_path}: {str(e)}")
+                continue
+
+            with it:
+                for entry in it:
+                    # Relative paths are "/"-separated on every platform, as
+                    # for remote panels.
+                    rel_path = f"{dir_rel}/{entry.name}" if dir_rel else entry.name
+
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        if (
+                            dir_re.match(rel_path + "/")
+                            or path_re.match(rel_path)
+                            or name_re.match(entry.name)
+                        ):
+                            continue
+                        files[rel_path] = {
+                            "type": "dir",
+                            "full_path": entry.path,
+                            "parent": dir_rel,
+                        }
+                        if recursive:
+                            stack.append((entry.path, rel_path))
+                        continue
+
+                    if path_re.match(rel_path):
+                        continue
+
+                    try:
+                        stat_info = entry.stat()
+                        files[rel_path] = {
+                            "size": stat_info.st_size,
+                            "modified": stat_info.st_mtime,
+                            "full_path": entry.path,
+                            "type": "file",
+                            "parent": dir_rel,
+                        }
+                    except OSError as e:
+                        self._log(f"Error accessing {entry.path}: {str(e)}")
+
+        return files
+
+    def _detect_stat_flavor(self, ssh_client: paramiko.SSHClient) -> str:
+        """Detect which stat implementation a remote host provides.
+
+        The result is cached per SSH endpoint, so the probe runs only once.
+
+        Args:
+            ssh_client: SSH client to use
+
+        Returns:
+            One of the REMOTE_FIND_COMMANDS keys: "GNU find", "GNU",
+            "BusyBox" or "BSD"
+        """
+        host_key = self._ssh_host_key(ssh_client)
+        flavor = self._stat_flavor_cache.get(host_key)
+        if flavor:
+            return flavor
+
+        # Probe GNU find -printf, then GNU and BusyBox stat, falling back to
+        # BSD, in a single command.
+        stdin, stdout, stderr = ssh_client.exec_command(
+            "find / -maxdepth 0 -printf '' >/dev/null 2>&1 && echo GNU find"
+            " || (stat --version >/dev/null 2>&1 && echo GNU)"
+            " || (stat --help 2>&1 | grep -q BusyBox && echo BusyBox || echo BSD)"
+        )
+        flavor = stdout.read().decode().strip()
+        if flavor not in REMOTE_FIND_COMMANDS:
+            flavor = "BSD"
+
+        self._log(f"Remote scan flavor: {flavor}.")
+        self._stat_flavor_cache[host_key] = flavor
+        return flavor
+
+    def _scan_remote(
+        self,
+        folder_path: str,
+        ssh_client: paramiko.SSHClient,
+        rules: Optional[list] = None,
+        use_cache: bool = False,
+    ) -> dict:
+        """Scan remote folder using SSH.
+
+        Args:
+            folder_path: Remote path to scan
+            ssh_client: SSH client to use
+            rules: Filter rules to apply
+            use_cache: Whether a recent scan of the same root may be reused
 
         Returns:
             Dictionary of scanned files
@@ -1624,85 +2367,77 @@ class GSynchro:
         if rules is None:
             rules = []
 
-        # Determine the correct stat command format (GNU, BusyBox, or BSD).
+        # Reuse a recent scan of the same root with the same rules. Callers
+        # modify the entries, so the cache holds and hands out copies.
+        cache_key = (self._ssh_host_key(ssh_client), folder_path, tuple(sorted(rules)))
+        cached = self._remote_scan_cache.get(cache_key) if use_cache else None
+        if cached and time.monotonic() - cached[0] < REMOTE_SCAN_TTL:
+            self._log(f"Using cached remote scan for {folder_path}")
+            return {k: dict(v) for k, v in cached[1].items()}
+
         try:
-            # 1. Check for GNU stat.
-            stdin, stdout, stderr = ssh_client.exec_command(
-                "stat --version > /dev/null 2>&1"
+            flavor = self._detect_stat_flavor(ssh_client)
+            find_command = REMOTE_FIND_COMMANDS[flavor].format(
+                path=_posix_quote(folder_path)
             )
-            if stdout.channel.recv_exit_status() == 0:
-                stat_command = "stat -c '%n|%F|%s|%Y'"
-                is_busybox = False
-                self._log("Remote system uses GNU stat.")
-            else:
-                # 2. Check for BusyBox stat.
-                stdin, stdout, stderr = ssh_client.exec_command(
-                    "stat --help 2>&1 | grep -q BusyBox"
-                )
-                if stdout.channel.recv_exit_status() == 0:
-                    # BusyBox stat. We get type separately.
-                    stat_command = "stat -c '%n|%s|%Y'"
-                    is_busybox = True
-                    self._log("Remote system uses BusyBox stat.")
-                else:
-                    # 3. Fallback to BSD stat.
-                    stat_command = "stat -f '%N|%HT|%z|%m'"
-                    is_busybox = False
-                    self._log("Remote system uses BSD stat.")
 
-            # Construct the full find command; quote the remote folder_path Use
-            # a raw f-string so the backslash-semicolon sequence is preserved
-            # without triggering Python's invalid-escape warnings.
-            find_command = rf"find {_posix_quote(folder_path)} -mindepth 1 -exec {stat_command} {{}} \; 2>/dev/null"
+            path_re, _, name_re = self._compile_rules(rules)
 
-            stdin, stdout, stderr = ssh_client.exec_command(find_command)
+            # Parse the channel as chunks arrive instead of buffering the
+            # whole listing, so parsing overlaps with the remote find.
+            stdin, stdout, stderr = ssh_client.exec_command(
+                find_command, bufsize=SCAN_BUFFER_SIZE
+            )
 
-            for line in stdout.readlines():
+            for line in _iter_channel_lines(stdout.channel):
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    filepath = ""
-                    if is_busybox:
-                        filepath, size, mtime = line.split("|")  # noqa: B007
-                        # For BusyBox, we determine type with a separate check.
-                        is_dir_stdin, is_dir_stdout, _ = ssh_client.exec_command(
-                            f"if [ -d {_posix_quote(filepath)} ]; then echo 'dir'; fi"
-                        )
-                        filetype = (
-                            "directory"
-                            if is_dir_stdout.read().decode().strip() == "dir"
-                            else "regular file"
-                        )
-                    else:
-                        filepath, filetype, size, mtime = line.split("|")
+                    filepath, filetype, size, mtime = line.split("|")
 
                     if not filepath.startswith(folder_path):
                         continue
 
                     rel_path = filepath[len(folder_path) :].lstrip("/")
 
-                    # Apply filtering logic (simplified for clarity).
-                    if any(fnmatch.fnmatch(rel_path, r) for r in rules) or any(
-                        fnmatch.fnmatch(part, r)
-                        for r in rules
-                        for part in rel_path.split("/")
+                    # Apply filtering logic (simplified for clarity). find
+                    # lists folders before their contents, so when the parent
+                    # was kept its names already passed and only the last
+                    # name needs checking.
+                    parent, _, name = rel_path.rpartition("/")
+                    if parent in files:
+                        parts = (name,)
+                    else:
+                        parts = rel_path.split("/")
+                    if path_re.match(rel_path) or any(
+                        name_re.match(part) for part in parts
                     ):
                         continue
 
-                    if "directory" in filetype.lower():
-                        files[rel_path] = {"type": "dir", "full_path": filepath}
+                    if filetype == "d" or "directory" in filetype.lower():
+                        files[rel_path] = {
+                            "type": "dir",
+                            "full_path": filepath,
+                            "parent": parent,
+                        }
                     else:
                         files[rel_path] = {
                             "size": int(size),
                             "modified": float(mtime),
                             "full_path": filepath,
                             "type": "file",
+                            "parent": parent,
                         }
                 except (ValueError, IndexError):
                     self._log(f"Warning: Could not parse stat line: '{line}'")
 
+            self._remote_scan_cache[cache_key] = (
+                time.monotonic(),
+                {k: dict(v) for k, v in files.items()},
+            )
+
         except Exception as e:
             self._log(f"Error scanning remote folder {folder_path}: {str(e)}")
 
@@ -1723,8 +2458,10 @@ class GSynchro:
             Hierarchical tree structure
         """
         tree_structure = {}
-        for filepath in sorted(files.keys()):
-            parts = filepath.replace(os.sep, "/").split("/")
+        # Insertion order is enough: display order is decided per level when
+        # the tree is populated.
+        for filepath, info in files.items():
+            parts = filepath.split("/")
             current_level = tree_structure
 
             for part in parts[:-1]:
@@ -1736,7 +2473,11 @@ class GSynchro:
 
             final_part = parts[-1]
             if final_part:
-                current_level[final_part] = files[filepath]
+                node = current_level.get(final_part)
+                if isinstance(node, dict) and info.get("type") == "dir":
+                    # Children were seen before their folder entry.
+                    info.update(node)
+                current_level[final_part] = info
 
         return tree_structure
 
@@ -1762,26 +2503,33 @@ class GSynchro:
             tree.column("#0", stretch=False)
 
         # Clear existing items.
-        for item in tree.get_children():
-            tree.delete(item)
+        tree.delete(*tree.get_children())
 
         if filter_rules is None:
             current_filter_rules = []
         else:
             current_filter_rules = filter_rules
 
+        # The scans share the same compiled rules, so this is usually a hit.
+        filter_re, _, _ = self._compile_rules(current_filter_rules)
+
+        tree_command = str(tree)
+        tags = "{black custom_font}"
+        dir_values = f"[list {UNCHECKED_CHAR} {{}} {{}} {{}}]"
+        script = []
+
         def insert_items(
             parent_node: str,
             data: dict,
-            filter_rules_for_insertion: list,
+            filter_re_for_insertion: re.Pattern,
             current_path_prefix: str = "",
         ):
-            """Recursively insert items into the tree.
+            """Recursively add the insert commands for items to the script.
 
             Args:
                 parent_node: Parent node ID
                 data: Data to insert
-                filter_rules_for_insertion: Filter rules to apply
+                filter_re_for_insertion: Compiled filter rules to apply
                 current_path_prefix: Current path prefix
             """
             items = sorted(data.items())
@@ -1790,63 +2538,57 @@ class GSynchro:
                     continue
 
                 # Apply filter rules.
-                if any(
-                    fnmatch.fnmatch(
-                        os.path.join(current_path_prefix, name).replace(os.sep, "/"),
-                        pattern,
-                    )
-                    for pattern in filter_rules_for_insertion
-                ):
+                rel_path = posixpath.join(current_path_prefix, name)
+                if filter_re_for_insertion.match(rel_path):
                     continue
 
                 if isinstance(content, dict) and "size" not in content:
                     # Directory.
-                    node = tree.insert(
-                        parent_node,
-                        "end",
-                        text=name,
-                        values=(UNCHECKED_CHAR, "", "", ""),
-                        tags=("black", "custom_font"),
-                        open=False,
+                    node = f"n{len(item_paths)}"
+                    item_paths[node] = rel_path
+                    script.append(
+                        f"{tree_command} insert {parent_node} end -id {node}"
+                        f" -text {_tcl_quote(name)} -values {dir_values}"
+                        f" -tags {tags} -open 0"
                     )
                     insert_items(
                         node,
                         content,
-                        filter_rules_for_insertion,
-                        os.path.join(current_path_prefix, name),
+                        filter_re_for_insertion,
+                        rel_path,
                     )
                 else:
                     # File.
                     if content and "size" in content:
-                        tree.insert(
-                            parent_node,
-                            "end",
-                            text=name,
-                            values=(
-                                UNCHECKED_CHAR,
-                                self._format_size(content["size"]),
-                                self._format_time(content["modified"]),
-                                "",
-                            ),
-                            tags=("black", "custom_font"),
+                        node = f"n{len(item_paths)}"
+                        item_paths[node] = rel_path
+                        size = _tcl_quote(self._format_size(content["size"]))
+                        modified = _tcl_quote(self._format_time(content["modified"]))
+                        script.append(
+                            f"{tree_command} insert {parent_node} end -id {node}"
+                            f" -text {_tcl_quote(name)}"
+                            f" -values [list {UNCHECKED_CHAR} {size} {modified} {{}}]"
+                            f" -tags {tags}"
                         )
 
-        insert_items("", structure, current_filter_rules, "")
+        # Insert all rows with a single Tcl script instead of one call per
+        # row; Tk lays the tree out once, after the script has run.
+        item_paths: dict[str, str] = {}
+        self._tree_item_paths[str(tree)] = item_paths
+        insert_items("{}", structure, filter_re, "")
+        if script:
+            tree.tk.eval("\n".join(script))
 
         # Configure the custom_font tag with current font settings.
         font_family = self.options["font_family"]  # noqa: B007
         font_size = self.options["font_size"]
         tree.tag_configure("custom_font", font=(font_family, font_size))
 
-    def _build_tree_map(
-        self, tree: Optional[ttk.Treeview], parent_item: str = "", path: str = ""
-    ) -> dict:
+    def _build_tree_map(self, tree: Optional[ttk.Treeview]) -> dict:
         """Build path to item ID map for a tree.
 
         Args:
             tree: Treeview widget
-            parent_item: Parent item ID
-            path: Current path
 
         Returns:
             Dictionary mapping paths to item IDs
@@ -1855,12 +2597,18 @@ class GSynchro:
         if not tree:
             return path_map
 
-        for item_id in tree.get_children(parent_item):
-            item_text = tree.item(item_id, "text")
-            current_path = os.path.join(path, item_text)
+        # Paths recorded by _batch_populate_tree need no walk of the tree.
+        item_paths = self._tree_item_paths.get(str(tree))
+        if item_paths is not None:
+            return {rel_path: item_id for item_id, rel_path in item_paths.items()}
+
+        pending = deque((item_id, "") for item_id in tree.get_children(""))
+        while pending:
+            item_id, parent_path = pending.popleft()
+            current_path = posixpath.join(parent_path, tree.item(item_id, "text"))
             path_map[current_path] = item_id
-            if tree.get_children(item_id):
-                path_map.update(self._build_tree_map(tree, item_id, current_path))
+            for child_id in tree.get_children(item_id):
+                pending.append((child_id, current_path))
 
         return path_map
 
@@ -1884,28 +2632,52 @@ class GSynchro:
         if tree is None:
             return
 
-        current_values = tree.item(item_id, "values")
-        check_char = (
-            CHECKED_CHAR if self.sync_states.get(rel_path, False) else UNCHECKED_CHAR
-        )
+        check_char = _CHECK_CHARS[self.sync_states.get(rel_path, False)]
 
-        tree.item(
-            item_id,
-            values=(
-                check_char,
-                current_values[1] if len(current_values) > 1 else "",
-                current_values[2] if len(current_values) > 2 else "",
-                status,
-            ),
-            tags=(status_color, "custom_font"),
-        )
+        # Write only the changed cells; size and modified are left untouched,
+        # so the current values need not be read back.
+        tree.set(item_id, "sync", check_char)
+        tree.set(item_id, "status", status)
+        tree.item(item_id, tags=(status_color, "custom_font"))
 
     # ==========================================================================
     # COMPARISON METHODS
     # ==========================================================================
 
-    def compare_folders(self):
-        """Compare files between panels."""
+    def _schedule_compare(self):
+        """Schedule a comparison shortly, unless one is already scheduled.
+
+        Syncs that finish close together then share a single rescan.
+        """
+        if self._compare_after_id is None:
+            self._compare_after_id = self.root.after(100, self._run_scheduled_compare)
+
+    def _run_scheduled_compare(self):
+        """Run the comparison scheduled by _schedule_compare."""
+        self._compare_after_id = None
+        self.compare_folders()
+
+    def compare_folders(
+        self,
+        use_scan_cache: bool = False,
+        active_rules: Optional[list] = None,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        """Compare files between panels.
+
+        Args:
+            use_scan_cache: Whether recent remote scans may be reused; only
+                filter-driven rescans do, an explicit compare always rescans
+            active_rules: Optional filter rules to apply instead of the saved
+                ones
+            on_done: Optional callback run on the main thread once both trees
+                show the comparison
+        """
+        # The trees are about to be redrawn, maybe with other rules.
+        self._last_apply_fingerprint = None
+        if not use_scan_cache:
+            self._remote_scan_cache.clear()
+
         # Prepare UI-related data on the main thread before starting the
         # background thread.
         folder_a_path = self.folder_a.get()
@@ -1925,20 +2697,34 @@ class GSynchro:
                 # Step 1: Scan folders in parallel.
                 use_ssh_a = self._has_ssh_a()
                 use_ssh_b = self._has_ssh_b()
-                rules = self._get_active_filters()
+                rules = (
+                    self._get_active_filters() if active_rules is None else active_rules
+                )
 
                 with ThreadPoolExecutor(max_workers=2) as executor:
                     future_a = executor.submit(
-                        self._scan_folder, folder_a_path, use_ssh_a, None, "A", rules
+                        self._scan_folder,
+                        folder_a_path,
+                        use_ssh_a,
+                        None,
+                        "A",
+                        rules,
+                        use_scan_cache,
                     )
                     future_b = executor.submit(
-                        self._scan_folder, folder_b_path, use_ssh_b, None, "B", rules
+                        self._scan_folder,
+                        folder_b_path,
+                        use_ssh_b,
+                        None,
+                        "B",
+                        rules,
+                        use_scan_cache,
                     )
                     self.files_a = future_a.result()
                     self.files_b = future_b.result()
 
                 # Step 2: Prepare for comparison (still in background thread).
-                total_items = len(set(self.files_a.keys()) | set(self.files_b.keys()))
+                total_items = len(self.files_a.keys() | self.files_b.keys())
                 self.root.after(
                     0, self._start_progress, None, total_items, "Comparing files..."
                 )
@@ -1948,12 +2734,14 @@ class GSynchro:
                     use_ssh_a, use_ssh_b, self.files_a, self.files_b
                 )
 
-                # Step 4: Schedule final UI updates on the main thread.
+                # Step 4: Build the tree structures (still in background thread).
+                tree_structure_a = self._build_tree_structure(self.files_a)
+                tree_structure_b = self._build_tree_structure(self.files_b)
+
+                # Step 5: Schedule final UI updates on the main thread.
                 def final_ui_update():
                     """This function runs on the main thread to update the UI safely."""
                     # Populate trees with scanned data.
-                    tree_structure_a = self._build_tree_structure(self.files_a)
-                    tree_structure_b = self._build_tree_structure(self.files_b)
                     if self.tree_a:
                         self._batch_populate_tree(self.tree_a, tree_structure_a, rules)
                     if self.tree_b:
@@ -1969,10 +2757,11 @@ class GSynchro:
                     )
 
                     # Adjust column widths after applying comparison results.
-                    if self.tree_a:
-                        self._adjust_tree_column_widths(self.tree_a)
-                    if self.tree_b:
-                        self._adjust_tree_column_widths(self.tree_b)
+                    self._schedule_column_widths(self.tree_a)
+                    self._schedule_column_widths(self.tree_b)
+
+                    if on_done is not None:
+                        on_done()
 
                 self.root.after(0, final_ui_update)
 
@@ -1999,7 +2788,7 @@ class GSynchro:
         Returns:
             A tuple containing (item_statuses, stats).
         """
-        all_paths = set(files_a.keys()) | set(files_b.keys())
+        all_paths = files_a.keys() | files_b.keys()
         if use_ssh_a or use_ssh_b:
             self._log("Parallel comparison (remote)")
             ssh_config_a = self._get_ssh_config_for_panel("A")
@@ -2044,20 +2833,32 @@ class GSynchro:
             dirty_folders: The set of folders initially marked as dirty.
         """
         # This set will store the full paths of all parent directories that
-        # contain a change.
-        parents_to_mark_different = set()
-        for path in dirty_folders:
-            # A folder that contains changes is itself different.
-            parents_to_mark_different.add(path)
+        # contain a change. A folder that contains changes is itself different.
+        parents_to_mark_different = set(dirty_folders)
+
+        def unseen_ancestors(path: str) -> Iterator[str]:
+            """Yield ancestors of a path up to the first one already collected.
 
-            # Start from the immediate parent of the changed item.
-            current_path = os.path.dirname(path)
+            The collected ancestor's own parents are collected too (or will
+            be, if it is itself dirty), so shared ancestors are visited once.
+
+            Args:
+                path: Relative path of a dirty folder
+
+            Yields:
+                Ancestor paths, nearest first
+            """
+            current_path = posixpath.dirname(path)
+            while (
+                current_path
+                and current_path != "."
+                and current_path not in parents_to_mark_different
+            ):
+                yield current_path
+                current_path = posixpath.dirname(current_path)
 
-            # Traverse up the directory tree to the root.
-            while current_path and current_path != ".":
-                parents_to_mark_different.add(current_path)
-                parent = os.path.dirname(current_path)
-                current_path = parent
+        for path in dirty_folders:
+            parents_to_mark_different.update(unseen_ancestors(path))
 
         # If any item caused a "dirty" folder, the root directory is also
         # considered different.
@@ -2065,14 +2866,15 @@ class GSynchro:
             parents_to_mark_different.add(".")
 
         # Now, apply the 'Different' status only to the collected parent
-        # directories. This avoids incorrectly overwriting the status of unique
-        # items themselves.
-        for path in parents_to_mark_different:
-            # Only mark a path as 'Different' if it's not already a unique item.
-            # This ensures unique folders containing other unique items remain
-            # 'Only in A/B'.
-            if item_statuses.get(path, (None,))[0] not in ("Only in A", "Only in B"):
-                item_statuses[path] = ("Different", "magenta")
+        # directories. Unique folders containing other unique items keep
+        # their 'Only in A/B' status.
+        unique_paths = {
+            path
+            for path, (status, _) in item_statuses.items()
+            if status in ("Only in A", "Only in B")
+        }
+        for path in parents_to_mark_different - unique_paths:
+            item_statuses[path] = STATUS_DIFFERENT_FOLDER
 
     def _prepare_comparison_data(self) -> tuple:
         """Prepare data structures needed for comparison.
@@ -2082,7 +2884,7 @@ class GSynchro:
         """
         tree_a_map = self._build_tree_map(self.tree_a)
         tree_b_map = self._build_tree_map(self.tree_b)
-        all_visible_paths = set(tree_a_map.keys()) | set(tree_b_map.keys())
+        all_visible_paths = tree_a_map.keys() | tree_b_map.keys()
         self.sync_states.clear()
         return tree_a_map, tree_b_map, all_visible_paths
 
@@ -2129,8 +2931,6 @@ class GSynchro:
         Returns:
             Tuple of (item_statuses, stats, dirty_folders)
         """
-        import time
-
         start_time = time.time()
         self._log(f"Parallel comparison: {max_workers} workers")
 
@@ -2148,141 +2948,194 @@ class GSynchro:
         file_paths = []
         dir_paths = []
 
-        for rel_path in all_visible_paths:
-            file_a_info = files_a.get(rel_path)
-            file_b_info = files_b.get(rel_path)
+        # Bind the lookups once; this loop runs for every visible path.
+        get_a = files_a.get
+        get_b = files_b.get
+        add_file = file_paths.append
+        add_dir = dir_paths.append
 
-            is_file_a = file_a_info and file_a_info.get("type") == "file"
-            is_dir_a = file_a_info and file_a_info.get("type") == "dir"
-            is_file_b = file_b_info and file_b_info.get("type") == "file"
-            is_dir_b = file_b_info and file_b_info.get("type") == "dir"
+        for rel_path in all_visible_paths:
+            file_a_info = get_a(rel_path)
+            file_b_info = get_b(rel_path)
+            type_a = file_a_info.get("type") if file_a_info else None
+            type_b = file_b_info.get("type") if file_b_info else None
 
             # Handle file vs. directory conflicts.
-            if (is_file_a and is_dir_b) or (is_dir_a and is_file_b):
-                item_statuses[rel_path] = ("Conflict", "black")
+            if (type_a == "file" and type_b == "dir") or (
+                type_a == "dir" and type_b == "file"
+            ):
+                item_statuses[rel_path] = STATUS_CONFLICT
                 stats["conflicts"] += 1
                 self.sync_states[rel_path] = True
-                dirty_folders.add(os.path.dirname(rel_path))
+                dirty_folders.add(file_a_info["parent"])
             # If it's a file on at least one side (and not a conflict).
-            elif is_file_a or is_file_b:
-                file_paths.append(rel_path)
+            elif type_a == "file" or type_b == "file":
+                add_file(rel_path)
             else:
                 # It's a directory on both sides, or only on one (and not a
                 # conflict).
-                dir_paths.append(rel_path)
+                add_dir(rel_path)
 
         self._log(f"Processing {len(file_paths)} files, {len(dir_paths)} dirs")
 
+        # Each worker thread checks out its SSH connections and SFTP sessions
+        # once, on first use, and keeps them for the whole comparison.
+        worker_state = threading.local()
+        worker_stacks = []
+        worker_stacks_lock = threading.Lock()
+
+        def get_worker_sftp(panel: str, ssh_config: dict) -> paramiko.SFTPClient:
+            """Return this worker's SFTP session for a panel, opening it once.
+
+            Args:
+                panel: Panel identifier ("A" or "B")
+                ssh_config: SSH configuration for the panel
+
+            Returns:
+                Open SFTP session
+            """
+            sessions = getattr(worker_state, "sessions", None)
+            if sessions is None:
+                stack = ExitStack()
+                with worker_stacks_lock:
+                    worker_stacks.append(stack)
+                sessions = worker_state.sessions = {"stack": stack}
+
+            if panel not in sessions:
+                stack = sessions["stack"]
+                ssh_client = stack.enter_context(
+                    self.connection_manager.get_connection(**ssh_config)
+                )
+                sftp = ssh_client.open_sftp()
+                stack.callback(sftp.close)
+                sessions[panel] = sftp
+            return sessions[panel]
+
         # Process files in parallel using connection pools.
         def compare_single_file(rel_path: str) -> tuple:
-            """Compare a single file using the connection pool.
+            """Compare a single file using the worker's SSH sessions.
 
             Args:
                 rel_path: Relative path of the file
 
             Returns:
-                Tuple of (rel_path, status, status_color)
+                Tuple of (rel_path, (status_text, color))
             """
             file_a_info = files_a.get(rel_path)
             file_b_info = files_b.get(rel_path)
 
-            # Use the connection pool for SSH connections only when needed.
-            if use_ssh_a and use_ssh_b:
-                # Both sides are remote - use two connections.
-                with (
-                    self.connection_manager.get_connection(**ssh_config_a) as ssh_a,
-                    self.connection_manager.get_connection(**ssh_config_b) as ssh_b,
-                ):
-                    status, status_color = self.comparer._compare_files(
-                        file_a_info,
-                        file_b_info,
-                        use_ssh_a,
-                        use_ssh_b,
-                        ssh_a,
-                        ssh_b,  # noqa: E501
-                    )
-            elif use_ssh_a:
-                # Only Panel A is remote - use one connection.
-                with self.connection_manager.get_connection(**ssh_config_a) as ssh_a:
-                    status, status_color = self.comparer._compare_files(
-                        file_a_info, file_b_info, use_ssh_a, False, ssh_a, None
-                    )
-            elif use_ssh_b:
-                # Only Panel B is remote - use one connection.
-                with self.connection_manager.get_connection(**ssh_config_b) as ssh_b:
-                    status, status_color = self.comparer._compare_files(
-                        file_a_info, file_b_info, False, use_ssh_b, None, ssh_b
-                    )
-            else:
-                # Both sides are local - no SSH needed.
-                status, status_color = self.comparer._compare_files(
-                    file_a_info, file_b_info, False, False, None, None
-                )
+            sftp_a = get_worker_sftp("A", ssh_config_a) if use_ssh_a else None
+            sftp_b = get_worker_sftp("B", ssh_config_b) if use_ssh_b else None
+            result = self.comparer._compare_files(
+                file_a_info,
+                file_b_info,
+                use_ssh_a,
+                use_ssh_b,
+                None,
+                None,
+                sftp_a,
+                sftp_b,
+                trust_mtime=trust_mtime,
+            )
 
-            return rel_path, status, status_color
+            return rel_path, result
 
-        # Process files in parallel.
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all file comparison tasks.
-            future_to_path = {
-                executor.submit(compare_single_file, rel_path): rel_path
-                for rel_path in file_paths
-            }
+        sync_states = self.sync_states
+        add_dirty = dirty_folders.add
+
+        def record_file_status(rel_path: str, result: tuple):
+            """Record a file's status and update stats and progress.
 
-            # Collect results as they complete.
-            for future in as_completed(future_to_path):
-                rel_path, status, status_color = future.result()
-                item_statuses[rel_path] = (status, status_color)
+            Args:
+                rel_path: Relative path of the file
+                result: Tuple of (status_text, color)
+            """
+            item_statuses[rel_path] = result
 
-                # Update stats.
-                if status == "Identical":
-                    stats["identical"] += 1
-                    self.sync_states[rel_path] = False
+            # Update stats.
+            stats_key = STATUS_STATS_KEYS[result[0]]
+            stats[stats_key] += 1
+            if stats_key == "identical":
+                sync_states[rel_path] = False
+            else:
+                sync_states[rel_path] = True
+                add_dirty((get_a(rel_path) or get_b(rel_path))["parent"])
+
+            # Update progress.
+            self._queue_progress()
+
+        # Settle everything the scanned metadata can decide right here, so
+        # only files whose contents must be read are handed to the workers.
+        trust_mtime = use_ssh_a or use_ssh_b
+        content_paths = []
+        compare_metadata = self.comparer._compare_metadata
+        for rel_path in file_paths:
+            status = compare_metadata(get_a(rel_path), get_b(rel_path), trust_mtime)
+            if status is None:
+                content_paths.append(rel_path)
+            else:
+                record_file_status(rel_path, status)
+
+        # When a panel is remote, hash the remaining files in bulk: one
+        # command per remote panel instead of reading every file over SFTP.
+        if content_paths and (use_ssh_a or use_ssh_b):
+            hashes_a = self.comparer._hash_files(
+                content_paths, files_a, use_ssh_a, ssh_config_a, max_workers
+            )
+            hashes_b = self.comparer._hash_files(
+                content_paths, files_b, use_ssh_b, ssh_config_b, max_workers
+            )
+            unhashed_paths = []
+            for rel_path in content_paths:
+                hash_a = hashes_a.get(rel_path)
+                hash_b = hashes_b.get(rel_path)
+                if not hash_a or not hash_b:
+                    unhashed_paths.append(rel_path)
+                elif hash_a == hash_b:
+                    record_file_status(rel_path, STATUS_IDENTICAL)
                 else:
-                    if status == "Different":
-                        stats["different"] += 1
-                        dirty_folders.add(os.path.dirname(rel_path))
-                    elif status == "Conflict":
-                        stats["conflicts"] += 1
-                        dirty_folders.add(os.path.dirname(rel_path))
-                    elif status == "Only in A":
-                        stats["only_a"] += 1
-                        dirty_folders.add(os.path.dirname(rel_path))
-                    elif status == "Only in B":
-                        stats["only_b"] += 1
-                        dirty_folders.add(os.path.dirname(rel_path))
-
-                    self.sync_states[rel_path] = True
-
-                # Update progress.
-                self.root.after(0, self._update_progress, 1)
+                    record_file_status(rel_path, STATUS_DIFFERENT)
+            self._log(f"Hashed {len(content_paths) - len(unhashed_paths)} files")
+            content_paths = unhashed_paths
+
+        # Process the remaining files in parallel.
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all file comparison tasks.
+                future_to_path = {
+                    executor.submit(compare_single_file, rel_path): rel_path
+                    for rel_path in content_paths
+                }
+
+                # Collect results as they complete.
+                for future in as_completed(future_to_path):
+                    record_file_status(*future.result())
+        finally:
+            # Hand the workers' connections back to the pool.
+            for stack in worker_stacks:
+                stack.close()
 
         # Process directories (these are fast, no need for parallel).
-        for rel_path in dir_paths:  # noqa: B007
-            file_a_info = files_a.get(rel_path)
-            file_b_info = files_b.get(rel_path)
+        for rel_path in dir_paths:
+            file_a_info = get_a(rel_path)
+            file_b_info = get_b(rel_path)
             is_dir_in_a = file_a_info and file_a_info.get("type") == "dir"
             is_dir_in_b = file_b_info and file_b_info.get("type") == "dir"
 
             if is_dir_in_a and not is_dir_in_b:
-                item_statuses[rel_path] = ("Only in A", "blue")
+                item_statuses[rel_path] = STATUS_ONLY_A
                 stats["only_a"] += 1
                 self.sync_states[rel_path] = True
-                dirty_folders.add(os.path.dirname(rel_path))
+                dirty_folders.add(file_a_info["parent"])
             elif is_dir_in_b and not is_dir_in_a:
-                item_statuses[rel_path] = ("Only in B", "red")
+                item_statuses[rel_path] = STATUS_ONLY_B
                 stats["only_b"] += 1
                 self.sync_states[rel_path] = True
-                dirty_folders.add(os.path.dirname(rel_path))
-
-        # Mark remaining shared directories as identical.
-        for rel_path in sorted(all_visible_paths):  # noqa: B007
-            is_dir_in_both = (
-                files_a.get(rel_path, {}).get("type") == "dir"
-                and files_b.get(rel_path, {}).get("type") == "dir"
-            )
-            if is_dir_in_both and rel_path not in item_statuses:
-                item_statuses[rel_path] = ("Identical", "green")
+                dirty_folders.add(file_b_info["parent"])
+            elif is_dir_in_a and is_dir_in_b:
+                # Shared directories start as identical; dirty ones are
+                # re-marked once their children have been compared.
+                item_statuses[rel_path] = STATUS_IDENTICAL
 
         elapsed_time = time.time() - start_time
         self._log(f"Parallel comparison done: {elapsed_time:.2f}s")
@@ -2305,20 +3158,21 @@ class GSynchro:
             tree_b_map: Panel B tree map
         """
         # Process items and apply status only to the panels where they exist.
+        update_item = self._update_tree_item
         for rel_path, (status, status_color) in item_statuses.items():
-            self.root.after(0, self._update_progress, 1)
-
             # Update Panel A if the item exists in its tree.
-            if rel_path in tree_a_map:
-                self._update_tree_item(
-                    self.tree_a, tree_a_map[rel_path], rel_path, status, status_color
-                )
+            item_a = tree_a_map.get(rel_path)
+            if item_a is not None:
+                update_item(self.tree_a, item_a, rel_path, status, status_color)
 
             # Update Panel B if the item exists in its tree.
-            if rel_path in tree_b_map:
-                self._update_tree_item(
-                    self.tree_b, tree_b_map[rel_path], rel_path, status, status_color
-                )
+            item_b = tree_b_map.get(rel_path)
+            if item_b is not None:
+                update_item(self.tree_b, item_b, rel_path, status, status_color)
+
+        # This already runs on the main thread: advance the progress bar once
+        # instead of queuing an event per item.
+        self._update_progress(len(item_statuses))
 
         status_summary = f"Identical: {stats['identical']}, "
         status_summary += f"Different: {stats['different']}, "
@@ -2416,7 +3270,7 @@ class GSynchro:
 
                 # Trigger UI refresh on the main thread After a sync, a full
                 # comparison is the cleanest way to update the UI state.
-                self.root.after(0, self.compare_folders)
+                self._schedule_compare()
 
                 self._log("Synchronization completed")
                 self.status_a.set("Synchronization completed successfully!")
@@ -2469,31 +3323,16 @@ class GSynchro:
         """
         files_to_sync = set()
 
-        # Normalize helper to compare relative paths in a consistent manner.
-        def _norm(p: str) -> str:
-            return p.replace(os.sep, "/")
-
+        # Checked folders need no expansion of their own: the files under them
+        # that are marked for sync are checked entries as well, so they are
+        # picked up directly here.
         for rel_path, is_checked in self.sync_states.items():
             if not is_checked:
                 continue
 
             source_item = source_files_dict.get(rel_path)
-            if not source_item:
-                continue
-
-            if source_item.get("type") == "file":
+            if source_item and source_item.get("type") == "file":
                 files_to_sync.add(rel_path)
-            elif source_item.get("type") == "dir":
-                # Only include files under this directory that are individually
-                # marked for sync.
-                dir_prefix = _norm(rel_path.rstrip(os.sep)) + "/"
-                for file_path, file_info in source_files_dict.items():
-                    if file_info.get("type") != "file":
-                        continue
-                    if _norm(file_path).startswith(dir_prefix) and self.sync_states.get(
-                        file_path, False
-                    ):
-                        files_to_sync.add(file_path)
 
         return sorted(files_to_sync)
 
@@ -2509,8 +3348,11 @@ class GSynchro:
         target_files_dict: dict,
     ):
         """Perform file synchronization."""
-        # Determine sync type based on source and target locations.
+        # The remote target is about to change, so cached listings are stale.
+        if target_use_ssh:
+            self._invalidate_remote_caches()
 
+        # Determine sync type based on source and target locations.
         if source_use_ssh and target_use_ssh:  # Remote to Remote.
             self._sync_remote_to_remote(
                 files_to_copy,
@@ -2557,26 +3399,18 @@ class GSynchro:
         """
         self._log(f"Syncing local files to {target_path}")
 
+        # Create each target directory once, not once per file.
+        target_dirs = {
+            os.path.dirname(os.path.join(target_path, rel_path))
+            for rel_path in files_to_copy
+        }
+        for target_dir in sorted(target_dirs):
+            os.makedirs(target_dir, exist_ok=True)
+
         for rel_path in files_to_copy:
             source_file = source_files_dict[rel_path]["full_path"]
             target_file = os.path.join(target_path, rel_path)
 
-            # Create target directory if needed.
-            target_dir = os.path.dirname(target_file)
-            os.makedirs(target_dir, exist_ok=True)
-
-            # Ensure target is writable.
-            if os.path.exists(target_file) and not os.access(target_file, os.W_OK):
-                if os.name == "posix":
-                    # On Linux/Unix/macOS: add owner write bit.
-                    current_mode = os.stat(target_file).st_mode
-                    os.chmod(target_file, current_mode | stat.S_IWUSR)
-                elif os.name == "nt":
-                    # On Windows: clear the read-only attribute.
-                    os.chmod(target_file, stat.S_IWRITE)
-                else:
-                    raise NotImplementedError(f"Unsupported OS: {os.name}")
-
             # Resolve conflicts by deleting target if it's a directory.
             target_item = target_files_dict.get(rel_path)
             if target_item and target_item.get("type") == "dir":
@@ -2584,11 +3418,44 @@ class GSynchro:
 
             self._log(f"Copying: {rel_path}")
             try:
-                shutil.copy2(source_file, target_file)
+                self._copy_local_file(source_file, target_file)
             except Exception as e:
                 self._log(f"Error copying {rel_path}: {e}")
             finally:
-                self.root.after(0, self._update_progress)
+                self._queue_progress()
+
+    def _copy_local_file(self, source_file: str, target_file: str):
+        """Copy a local file, making a read-only target writable if needed.
+
+        Most targets are writable, so the permission fix-up only runs after
+        a copy has failed.
+
+        Args:
+            source_file: Source file path
+            target_file: Target file path
+
+        Raises:
+            NotImplementedError: If the OS is not supported
+        """
+        try:
+            # copy2 already copies in the kernel where the OS allows it
+            # (sendfile on Linux, fcopyfile on macOS).
+            shutil.copy2(source_file, target_file)
+            return
+        except PermissionError:
+            if not os.path.isfile(target_file):
+                raise
+
+        if os.name == "posix":
+            # On Linux/Unix/macOS: add owner write bit.
+            current_mode = os.stat(target_file).st_mode
+            os.chmod(target_file, current_mode | stat.S_IWUSR)
+        elif os.name == "nt":
+            # On Windows: clear the read-only attribute.
+            os.chmod(target_file, stat.S_IWRITE)
+        else:
+            raise NotImplementedError(f"Unsupported OS: {os.name}")
+        shutil.copy2(source_file, target_file)
 
     def _sync_local_to_remote(
         self,
@@ -2598,7 +3465,7 @@ class GSynchro:
         ssh_client: Optional[paramiko.SSHClient],
         target_files_dict: dict,
     ):
-        """Sync local to remote using SCP.
+        """Sync local to remote using SFTP.
 
         Args:
             files_to_copy: List of files to copy
@@ -2615,33 +3482,23 @@ class GSynchro:
         if not transport:
             raise ConnectionError("SSH client for remote sync is not connected.")
 
-        with SCPClient(transport) as scp:
-            for rel_path in files_to_copy:
-                local_file = source_files_dict[rel_path]["full_path"]
-                remote_file = _posix_join(remote_path, rel_path)
+        self._prepare_remote_targets(
+            ssh_client, remote_path, files_to_copy, target_files_dict
+        )
 
-                # Create remote directory.
-                remote_dir = posixpath.dirname(remote_file)
-                try:
-                    sftp = ssh_client.open_sftp()
-                    sftp.stat(remote_dir)
-                except FileNotFoundError:
-                    self._log(f"Creating remote directory: {remote_dir}")
-                    stdin, stdout, stderr = ssh_client.exec_command(
-                        f"mkdir -p {_posix_quote(remote_dir)}"
-                    )
-                    stderr.read()
+        def copy_file(rel_path: str):
+            local_file = source_files_dict[rel_path]["full_path"]
+            remote_file = _posix_join(remote_path, rel_path)
 
-                # Resolve conflicts by deleting target if it's a directory.
-                target_item = target_files_dict.get(rel_path)
-                if target_item and target_item.get("type") == "dir":
-                    stdin, stdout, stderr = ssh_client.exec_command(
-                        f"rm -rf {_posix_quote(remote_file)}"
-                    )
-                    stderr.read()
+            # Skip the stat round trip that would confirm the upload size.
+            sftp = get_sftp()
+            sftp.put(local_file, remote_file, confirm=False)
+            # SFTP creates files with default permissions; keep the source
+            # mode, as SCP did.
+            sftp.chmod(remote_file, os.stat(local_file).st_mode & 0o7777)
 
-                scp.put(local_file, remote_file)
-                self.root.after(0, self._update_progress)
+        with self._worker_sftp_sessions(ssh_client) as get_sftp:
+            self._run_transfers(files_to_copy, copy_file)
 
     def _sync_remote_to_local(
         self,
@@ -2651,7 +3508,7 @@ class GSynchro:
         ssh_client: Optional[paramiko.SSHClient],
         target_files_dict: dict,
     ):
-        """Sync remote to local using SCP.
+        """Sync remote to local using SFTP.
 
         Args:
             files_to_copy: List of files to copy
@@ -2672,23 +3529,28 @@ class GSynchro:
                 "SSH client for remote-to-local sync is not connected."
             )
 
-        with SCPClient(transport) as scp:
-            for rel_path in files_to_copy:
-                remote_file = source_files_dict[rel_path]["full_path"]
-                local_file = os.path.join(local_path, rel_path)
+        def copy_file(rel_path: str):
+            remote_file = source_files_dict[rel_path]["full_path"]
+            local_file = os.path.join(local_path, rel_path)
 
-                # Create local directory.
-                local_dir = os.path.dirname(local_file)
-                os.makedirs(local_dir, exist_ok=True)
+            # Create local directory.
+            local_dir = os.path.dirname(local_file)
+            os.makedirs(local_dir, exist_ok=True)
 
-                # Resolve conflicts by deleting target if it's a directory.
-                target_item = target_files_dict.get(rel_path)
-                if target_item and target_item.get("type") == "dir":
-                    shutil.rmtree(local_file)
+            # Resolve conflicts by deleting target if it's a directory.
+            target_item = target_files_dict.get(rel_path)
+            if target_item and target_item.get("type") == "dir":
+                shutil.rmtree(local_file)
+
+            self._log(f"Downloading: {rel_path}")
+            sftp = get_sftp()
+            sftp.get(remote_file, local_file)
+            # SFTP creates files with default permissions; keep the source
+            # mode, as SCP did.
+            os.chmod(local_file, sftp.stat(remote_file).st_mode & 0o7777)
 
-                self._log(f"Downloading: {rel_path}")
-                scp.get(remote_file, local_file)
-                self.root.after(0, self._update_progress)
+        with self._worker_sftp_sessions(ssh_client) as get_sftp:
+            self._run_transfers(files_to_copy, copy_file)
 
     def _sync_remote_to_remote(
         self,
@@ -2715,54 +3577,195 @@ class GSynchro:
 
         self._log(f"Syncing remote files to remote {target_path}")
 
-        for rel_path in files_to_copy:
+        self._prepare_remote_targets(
+            target_ssh, target_path, files_to_copy, target_files_dict
+        )
+
+        def copy_file(rel_path: str):
             source_file_path = source_files_dict[rel_path]["full_path"]
             target_file_path = _posix_join(target_path, rel_path)
 
-            # Create target directory
-            target_dir = posixpath.dirname(target_file_path)
-            target_ssh.exec_command(f"mkdir -p {_posix_quote(target_dir)}")
+            self._log(f"Copying remote-to-remote: {rel_path}")
+            self._pipe_remote_file(
+                source_ssh, source_file_path, target_ssh, target_file_path
+            )
 
-            source_transport = source_ssh.get_transport()
-            target_transport = target_ssh.get_transport()
-            if not source_transport or not target_transport:
-                raise ConnectionError(
-                    "SSH transport not available for remote-to-remote sync."
-                )
+        self._run_transfers(files_to_copy, copy_file)
 
-            # Stream through local temp file.
-            with SCPClient(source_transport) as scp_source:
-                with SCPClient(target_transport) as scp_target:
-                    self._log(f"Copying remote-to-remote: {rel_path}")
-
-                    # Use a NamedTemporaryFile with delete=False and close it
-                    # before calling external tools (SCP) so the file is
-                    # accessible on platforms like Windows where an open file
-                    # can be locked by the creating process.
-                    temp_f = tempfile.NamedTemporaryFile(delete=False)
-                    temp_name = temp_f.name
-                    try:
-                        temp_f.close()
-                        scp_source.get(source_file_path, temp_name)
-
-                        # Resolve conflicts by deleting target if it's a directory.
-                        target_item = target_files_dict.get(rel_path)
-                        if target_item and target_item.get("type") == "dir":
-                            target_ssh.exec_command(
-                                f"rm -rf {_posix_quote(target_file_path)}"
-                            )
+    def _prepare_remote_targets(
+        self,
+        ssh_client: paramiko.SSHClient,
+        target_path: str,
+        files_to_copy: list,
+        target_files_dict: dict,
+    ):
+        """Create target directories and clear conflicts in one remote exec.
 
-                        scp_target.put(temp_name, target_file_path)
-                    finally:  # noqa: B007
-                        try:
-                            os.remove(temp_name)
-                        except Exception:
-                            # Best-effort cleanup; log and continue.
-                            self._log(
-                                f"Warning: could not remove temp file {temp_name}"
-                            )
+        Directories that block an incoming file are removed first, then every
+        missing parent directory is created. The commands are sent as a single
+        script instead of one round trip per file.
 
-            self.root.after(0, self._update_progress)
+        Args:
+            ssh_client: SSH client of the target host
+            target_path: Target remote path
+            files_to_copy: List of files to copy
+            target_files_dict: Dictionary of target files
+        """
+        conflicts = [
+            _posix_join(target_path, rel_path)
+            for rel_path in files_to_copy
+            if target_files_dict.get(rel_path, {}).get("type") == "dir"
+        ]
+        dirs = sorted(
+            {
+                posixpath.dirname(_posix_join(target_path, rel_path))
+                for rel_path in files_to_copy
+            }
+        )
+
+        script = []
+        for command, paths in (("rm -rf", conflicts), ("mkdir -p", dirs)):
+            for i in range(0, len(paths), REMOTE_SCRIPT_ARGS):
+                quoted = " ".join(map(_posix_quote, paths[i : i + REMOTE_SCRIPT_ARGS]))
+                script.append(f"{command} {quoted}")
+        if not script:
+            return
+
+        self._log(
+            f"Preparing {len(dirs)} remote directories, {len(conflicts)} conflicts"
+        )
+        stdin, stdout, stderr = ssh_client.exec_command("sh -s")
+        stdin.write("\n".join(script) + "\n")
+        stdin.channel.shutdown_write()
+        errors = stderr.read().decode("utf-8", errors="replace").strip()
+        stdout.channel.recv_exit_status()
+        if errors:
+            self._log(f"Remote prepare error: {errors}")
+
+    @contextmanager
+    def _worker_sftp_sessions(self, ssh_client: paramiko.SSHClient) -> Iterator:
+        """Hand out one SFTP session per worker thread on an SSH client.
+
+        Each thread opens its session on first use and keeps it for every
+        later transfer; all sessions are closed on exit.
+
+        Args:
+            ssh_client: SSH client to open the sessions on
+
+        Yields:
+            Function returning the calling thread's SFTP session
+        """
+        worker_state = threading.local()
+        sessions = []
+        sessions_lock = threading.Lock()
+
+        def get_sftp() -> paramiko.SFTPClient:
+            sftp = getattr(worker_state, "sftp", None)
+            if sftp is None:
+                sftp = worker_state.sftp = ssh_client.open_sftp()
+                with sessions_lock:
+                    sessions.append(sftp)
+            return sftp
+
+        try:
+            yield get_sftp
+        finally:
+            for sftp in sessions:
+                sftp.close()
+
+    def _run_transfers(self, files_to_copy: list, copy_file):
+        """Run per-file transfers concurrently over the open SSH transports.
+
+        SSH multiplexes channels over one connection, so several transfers in
+        flight keep the link busy while each waits for acknowledgements.
+
+        Args:
+            files_to_copy: List of files to copy
+            copy_file: Function copying one file, given its relative path
+
+        Raises:
+            Exception: The first error raised by a transfer
+        """
+        with ThreadPoolExecutor(max_workers=SYNC_TRANSFER_WORKERS) as executor:
+            for _ in executor.map(copy_file, files_to_copy):
+                self._queue_progress()
+
+    def _pipe_remote_file(
+        self,
+        source_ssh: paramiko.SSHClient,
+        source_file_path: str,
+        target_ssh: paramiko.SSHClient,
+        target_file_path: str,
+    ):
+        """Stream a file from one remote host to another through this host.
+
+        The bytes are relayed between two SSH channels in memory, without a
+        local temporary file. They are written to a temporary file next to
+        the target, which replaces the target, with the source mode, only
+        once the whole source has been read.
+
+        Args:
+            source_ssh: Source SSH client
+            source_file_path: Remote path of the file to read
+            target_ssh: Target SSH client
+            target_file_path: Remote path of the file to write
+
+        Raises:
+            OSError: If either remote command fails
+        """
+        source_path = _posix_quote(source_file_path)
+        target_path = _posix_quote(target_file_path)
+        temp_path = _posix_quote(target_file_path + ".gsynchro.tmp")
+
+        # The source mode (GNU or BSD stat, empty if neither works) comes
+        # first on a line of its own, then the data.
+        stdin, source_out, source_err = source_ssh.exec_command(
+            f"{{ stat -c %a {source_path} || stat -f %Lp {source_path} || echo;"
+            f" }} 2>/dev/null; cat {source_path}"
+        )
+        target_in, target_out, target_err = target_ssh.exec_command(
+            f"cat > {temp_path}"
+        )
+        source_channel = source_out.channel
+        target_channel = target_in.channel
+
+        data = b""
+        while b"\n" not in data:
+            chunk = source_channel.recv(REMOTE_PIPE_CHUNK_SIZE)
+            if not chunk:
+                break
+            data += chunk
+        mode, _, data = data.partition(b"\n")
+        if data:
+            target_channel.sendall(data)
+        while True:
+            data = source_channel.recv(REMOTE_PIPE_CHUNK_SIZE)
+            if not data:
+                break
+            target_channel.sendall(data)
+        target_channel.shutdown_write()
+
+        error = None
+        if source_channel.recv_exit_status() != 0:
+            error = source_err.read().decode().strip()
+            error = f"Failed to read {source_file_path}: {error}"
+        elif target_channel.recv_exit_status() != 0:
+            error = target_err.read().decode().strip()
+            error = f"Failed to write {target_file_path}: {error}"
+        if error:
+            # Leave the existing target untouched.
+            stdin, stdout, stderr = target_ssh.exec_command(f"rm -f {temp_path}")
+            stdout.channel.recv_exit_status()
+            raise OSError(error)
+
+        mode = mode.decode().strip()
+        chmod = f"chmod {mode} {temp_path} && " if mode.isdigit() else ""
+        stdin, stdout, stderr = target_ssh.exec_command(
+            f"{chmod}mv -f {temp_path} {target_path}"
+        )
+        error = stderr.read().decode().strip()
+        if stdout.channel.recv_exit_status() != 0:
+            raise OSError(f"Failed to write {target_file_path}: {error}")
 
     # ==========================================================================
     # FILTER MANAGEMENT METHODS
@@ -2798,19 +3801,19 @@ class GSynchro:
         tree_frame.grid(row=0, column=0, padx=10, pady=10, sticky=tk.NSEW)
 
         # Populate tree.
-        def populate_tree():
-            for item in filter_tree.get_children():
-                filter_tree.delete(item)
-            for i, item in enumerate(temp_filters):
-                check_char = (
-                    CHECKED_CHAR if item.get("active", True) else UNCHECKED_CHAR
-                )
-                filter_tree.insert("", "end", iid=i, values=(check_char, item["rule"]))
+        populate_tree, toggle_rows = self._filter_tree_renderer(
+            filter_tree, temp_filters
+        )
+
+        # Input and confirmation dialogs are built on first use, then hidden
+        # between uses and shown again.
+        rule_input = {}
+        remove_confirm = {}
 
         def _create_rule_input_dialog(
             title: str, prompt_text: str, initial_value: str = ""
         ) -> Optional[str]:
-            """Create a dialog to get a filter rule from the user.
+            """Show a dialog to get a filter rule from the user.
 
             Args:
                 title: Dialog title
@@ -2820,64 +3823,73 @@ class GSynchro:
             Returns:
                 User input or None if cancelled
             """
-            entry_var = tk.StringVar(value=initial_value)
-            result = None
-
-            def on_ok():
-                nonlocal result
-                result = entry_var.get()
-                input_dialog.destroy()
-
-            input_dialog = tk.Toplevel(dialog)
-            input_dialog.transient(dialog)
-            input_dialog.grab_set()
-            input_dialog.title(title)
-            input_dialog.minsize(300, 120)
-            input_dialog.maxsize(300, 120)
-            input_dialog.configure(bg=dialog_bg)
-            input_dialog.rowconfigure(0, weight=1)
-            input_dialog.columnconfigure(0, weight=1)
-
-            content_frame = ttk.Frame(input_dialog, padding=10)
-            content_frame.grid(row=0, column=0, sticky=tk.NSEW)
-            content_frame.columnconfigure(0, weight=1)
-
-            ttk.Label(content_frame, text=prompt_text).grid(
-                row=0, column=0, sticky=tk.W, pady=(0, 5)
-            )
-
-            entry = ttk.Entry(content_frame, textvariable=entry_var)
-            entry.grid(row=1, column=0, sticky=tk.EW)
-            entry.focus_set()
-            entry.select_range(0, "end")
-
-            button_frame = ttk.Frame(input_dialog, padding=(10, 0, 10, 10))
-            button_frame.grid(row=1, column=0, sticky=tk.EW)
-            button_frame.columnconfigure(0, weight=1)
-            button_frame.columnconfigure(1, weight=0)
-            button_frame.columnconfigure(2, weight=0)
-            button_frame.columnconfigure(3, weight=1)
-
-            GButton(
-                button_frame,
-                text="Cancel",
-                command=input_dialog.destroy,
-                width=80,
-                height=34,
-                **self.colors["buttons"]["default"],
-            ).grid(row=0, column=1, padx=5)
-            GButton(
-                button_frame,
-                text="OK",
-                command=on_ok,
-                width=80,
-                height=34,
-                **self.colors["buttons"]["primary"],
-            ).grid(row=0, column=2, padx=5)
+            if not rule_input:
+                input_dialog = tk.Toplevel(dialog)
+                input_dialog.withdraw()
+                input_dialog.transient(dialog)
+                input_dialog.minsize(300, 120)
+                input_dialog.maxsize(300, 120)
+                input_dialog.configure(bg=dialog_bg)
+                input_dialog.rowconfigure(0, weight=1)
+                input_dialog.columnconfigure(0, weight=1)
+
+                entry_var = tk.StringVar()
+                done_var = tk.BooleanVar()
+
+                def on_ok():
+                    rule_input["result"] = entry_var.get()
+                    done_var.set(True)
+
+                content_frame = ttk.Frame(input_dialog, padding=10)
+                content_frame.grid(row=0, column=0, sticky=tk.NSEW)
+                content_frame.columnconfigure(0, weight=1)
+
+                prompt_label = ttk.Label(content_frame)
+                prompt_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+
+                entry = ttk.Entry(content_frame, textvariable=entry_var)
+                entry.grid(row=1, column=0, sticky=tk.EW)
+
+                button_frame = ttk.Frame(input_dialog, padding=(10, 0, 10, 10))
+                button_frame.grid(row=1, column=0, sticky=tk.EW)
+                button_frame.columnconfigure(0, weight=1)
+                button_frame.columnconfigure(1, weight=0)
+                button_frame.columnconfigure(2, weight=0)
+                button_frame.columnconfigure(3, weight=1)
+
+                self._default_btn(
+                    button_frame,
+                    text="Cancel",
+                    command=lambda: done_var.set(True),
+                    width=80,
+                    height=34,
+                ).grid(row=0, column=1, padx=5)
+                self._primary_btn(
+                    button_frame,
+                    text="OK",
+                    command=on_ok,
+                    width=80,
+                    height=34,
+                ).grid(row=0, column=2, padx=5)
+
+                input_dialog.protocol("WM_DELETE_WINDOW", lambda: done_var.set(True))
+                rule_input.update(
+                    dialog=input_dialog,
+                    prompt=prompt_label,
+                    entry=entry,
+                    entry_var=entry_var,
+                    done=done_var,
+                )
 
-            self._center_dialog(input_dialog, relative_to=dialog)
-            input_dialog.wait_window()
-            return result
+            rule_input["result"] = None
+            rule_input["dialog"].title(title)
+            rule_input["prompt"].configure(text=prompt_text)
+            rule_input["entry_var"].set(initial_value)
+            rule_input["entry"].select_range(0, "end")
+            self._show_reusable_modal(
+                rule_input["dialog"], dialog, rule_input["done"], rule_input["entry"]
+            )
+            return rule_input["result"]
 
         # Context menu functions.
         def insert_rule():
@@ -2885,8 +3897,11 @@ class GSynchro:
                 "Insert Rule", "Enter new filter pattern:"
             )
             if new_rule and new_rule.strip():
-                temp_filters.append({"rule": new_rule.strip(), "active": True})
-                temp_filters.sort(key=lambda item: item["rule"])
+                bisect.insort(
+                    temp_filters,
+                    {"rule": new_rule.strip(), "active": True},
+                    key=_rule_key,
+                )
                 populate_tree()
 
         def edit_rule():
@@ -2902,52 +3917,60 @@ class GSynchro:
             )
 
             if edited_rule and edited_rule.strip():
-                temp_filters[index]["rule"] = edited_rule.strip()
-                temp_filters.sort(key=lambda item: item["rule"])
+                edited_item = temp_filters.pop(index)
+                edited_item["rule"] = edited_rule.strip()
+                bisect.insort(temp_filters, edited_item, key=_rule_key)
                 populate_tree()
 
         def remove_rule():
             selected_item = filter_tree.focus()
             if selected_item:
                 # Custom confirmation dialog.
-                confirm_dialog = tk.Toplevel(dialog)
-                confirm_dialog.transient(dialog)
-                confirm_dialog.grab_set()
-                confirm_dialog.title("Confirm Deletion")
-                confirm_dialog.configure(bg=dialog_bg)
-                ttk.Label(
-                    confirm_dialog,
-                    text="Are you sure you want to remove the selected rule?",
-                    padding=20,
-                ).pack()
-
-                confirmed = False
-
-                def on_yes():
-                    nonlocal confirmed
-                    confirmed = True
-                    confirm_dialog.destroy()
-
-                btn_frame = ttk.Frame(confirm_dialog, padding=10)
-                btn_frame.pack(fill="x")
-                GButton(
-                    btn_frame,
-                    text="Yes",
-                    command=on_yes,
-                    width=70,
-                    height=30,
-                    **self.colors["buttons"]["primary"],
-                ).pack(side="right", padx=5)
-                GButton(
-                    btn_frame,
-                    text="No",
-                    command=confirm_dialog.destroy,
-                    width=70,
-                    height=30,
-                    **self.colors["buttons"]["default"],
-                ).pack(side="right")
-
-                confirm_dialog.wait_window()
+                if not remove_confirm:
+                    confirm_dialog = tk.Toplevel(dialog)
+                    confirm_dialog.withdraw()
+                    confirm_dialog.transient(dialog)
+                    confirm_dialog.title("Confirm Deletion")
+                    confirm_dialog.configure(bg=dialog_bg)
+                    ttk.Label(
+                        confirm_dialog,
+                        text="Are you sure you want to remove the selected rule?",
+                        padding=20,
+                    ).pack()
+
+                    done_var = tk.BooleanVar()
+
+                    def on_yes():
+                        remove_confirm["confirmed"] = True
+                        done_var.set(True)
+
+                    btn_frame = ttk.Frame(confirm_dialog, padding=10)
+                    btn_frame.pack(fill="x")
+                    self._primary_btn(
+                        btn_frame,
+                        text="Yes",
+                        command=on_yes,
+                        width=70,
+                        height=30,
+                    ).pack(side="right", padx=5)
+                    self._default_btn(
+                        btn_frame,
+                        text="No",
+                        command=lambda: done_var.set(True),
+                        width=70,
+                        height=30,
+                    ).pack(side="right")
+
+                    confirm_dialog.protocol(
+                        "WM_DELETE_WINDOW", lambda: done_var.set(True)
+                    )
+                    remove_confirm.update(dialog=confirm_dialog, done=done_var)
+
+                remove_confirm["confirmed"] = False
+                self._show_reusable_modal(
+                    remove_confirm["dialog"], dialog, remove_confirm["done"]
+                )
+                confirmed = remove_confirm["confirmed"]
 
                 if confirmed:
                     index = int(selected_item)
@@ -2980,11 +4003,7 @@ class GSynchro:
 
             item_id = filter_tree.identify_row(event.y)
             if item_id:
-                index = int(item_id)
-                temp_filters[index]["active"] = not temp_filters[index].get(
-                    "active", True
-                )
-                populate_tree()
+                toggle_rows([int(item_id)])
 
         def show_context_menu(event: tk.Event):
             item_id = filter_tree.identify_row(event.y)
@@ -3012,46 +4031,13 @@ class GSynchro:
 
         # Buttons.
         def apply_filters():
-            active_rules = [
-                item["rule"] for item in temp_filters if item.get("active", True)
-            ]
-            self._log(f"Applying active filters: {active_rules}")
-
-            # Clear file lists and trees.
-            self.files_a.clear()
-            self.files_b.clear()
-            self._update_status("A", self.files_a)
-            self._update_status("B", self.files_b)
-            if self.tree_a:
-                self._batch_populate_tree(self.tree_a, {})
-            if self.tree_b:
-                self._batch_populate_tree(self.tree_b, {})
-
-            def run_scans_and_compare():
-                scan_threads = []
-                if self.folder_a.get():
-                    thread_a = self._populate_single_panel(
-                        "A", self.folder_a.get(), active_rules=active_rules
-                    )
-                    scan_threads.append(thread_a)
-                if self.folder_b.get():
-                    thread_b = self._populate_single_panel(
-                        "B", self.folder_b.get(), active_rules=active_rules
-                    )
-                    scan_threads.append(thread_b)
-
-                # Wait for scanning threads.
-                for t in scan_threads:
-                    t.join()
-
-                # Run comparison.
-                self.root.after(0, self.compare_folders)
-
-            threading.Thread(target=run_scans_and_compare, daemon=True).start()
+            self._apply_filters(
+                [item["rule"] for item in temp_filters if item["active"]]
+            )
 
         def save_and_close():
-            self.filter_rules = temp_filters
-            self.filter_rules.sort(key=lambda item: item["rule"])
+            # Kept sorted by rule as it is edited.
+            self._set_filter_rules(temp_filters)
             apply_filters()
             dialog.destroy()
 
@@ -3062,29 +4048,26 @@ class GSynchro:
         button_frame.columnconfigure(0, weight=1)
         button_frame.columnconfigure(4, weight=1)
 
-        GButton(
+        self._primary_btn(
             button_frame,
             text="Save",
             command=save_and_close,
             width=80,
             height=34,
-            **self.colors["buttons"]["primary"],
         ).grid(row=0, column=3, padx=5)
-        GButton(
+        self._default_btn(
             button_frame,
             text="Apply",
             command=apply_filters,
             width=80,
             height=34,
-            **self.colors["buttons"]["default"],
         ).grid(row=0, column=2, padx=5)
-        GButton(
+        self._default_btn(
             button_frame,
             text="Cancel",
             command=dialog.destroy,
             width=80,
             height=34,
-            **self.colors["buttons"]["default"],
         ).grid(row=0, column=1, padx=5)
 
         # Center dialog.
@@ -3098,27 +4081,8 @@ class GSynchro:
         dialog.transient(self.root)
         dialog.grab_set()
 
-        # Center the dialog relative to parent window.
-        def center_dialog():
-            """Center the dialog after it's fully mapped."""
-            dialog.update_idletasks()
-
-            # Get parent window center.
-            parent_x = self.root.winfo_rootx() + self.root.winfo_width() // 2
-            parent_y = self.root.winfo_rooty() + self.root.winfo_height() // 2
-
-            # Get dialog dimensions (including decorations).
-            dialog_width = dialog.winfo_width()
-            dialog_height = dialog.winfo_height()
-
-            # Calculate final position to center the dialog.
-            dialog_x = parent_x - dialog_width // 2
-            dialog_y = parent_y - dialog_height // 2
-
-            dialog.geometry(f"+{dialog_x}+{dialog_y}")
-
-        # Schedule centering after dialog is mapped.
-        dialog.after(100, center_dialog)
+        # Center once the widgets below have been laid out.
+        dialog.after_idle(self._center_dialog, dialog)
 
         # Prevent resizing.
         dialog.resizable(False, False)
@@ -3139,102 +4103,102 @@ class GSynchro:
         filters_frame = ttk.Frame(notebook, padding="10")
         notebook.add(filters_frame, text="Filters")
 
-        # Create a temporary copy to work with.
+        # Create a temporary copy to work with, and remember the rules as they
+        # were when the dialog opened to detect changes on apply.
         temp_filters = [dict(item) for item in self.filter_rules]
+        old_filters = _filters_fingerprint(self.filter_rules)
 
         # Tree view for filters.
         tree_frame, filter_tree = self._create_filter_tree(filters_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 0))
 
         # Populate tree.
-        def populate_tree():
-            for item in filter_tree.get_children():
-                filter_tree.delete(item)
-            for i, item in enumerate(temp_filters):  # noqa: B007
-                check_char = (
-                    CHECKED_CHAR if item.get("active", True) else UNCHECKED_CHAR
-                )
-                filter_tree.insert("", "end", iid=i, values=(check_char, item["rule"]))
+        populate_tree, toggle_rows = self._filter_tree_renderer(
+            filter_tree, temp_filters
+        )
+
+        # The input dialog is built on first use, then hidden between uses.
+        rule_input = {}
 
         def _create_rule_input_dialog(
             title: str,
             prompt_text: str,
             initial_value: str = "",  # type: ignore
         ) -> Optional[str]:
-            """Create a dialog to get a filter rule from the user."""
-            entry_var = tk.StringVar(value=initial_value)
-            result = None
-
-            rule_dialog = tk.Toplevel(dialog)
-            rule_dialog.title(title)
-            rule_dialog.transient(dialog)
-            rule_dialog.grab_set()
-            rule_dialog.resizable(False, False)
-
-            # Center the dialog.
-            def center_rule_dialog():
-                rule_dialog.update_idletasks()
-                parent_x = dialog.winfo_rootx() + dialog.winfo_width() // 2
-                parent_y = dialog.winfo_rooty() + dialog.winfo_height() // 2
-                dialog_width = rule_dialog.winfo_width()
-                dialog_height = rule_dialog.winfo_height()
-                dialog_x = parent_x - dialog_width // 2
-                dialog_y = parent_y - dialog_height // 2
-                rule_dialog.geometry(f"+{dialog_x}+{dialog_y}")
-
-            rule_dialog.after(100, center_rule_dialog)
-
-            main_frame = ttk.Frame(rule_dialog, padding="20")
-            main_frame.pack()
-
-            ttk.Label(main_frame, text=prompt_text).pack(anchor=tk.W, pady=(0, 5))
-            entry = ttk.Entry(main_frame, textvariable=entry_var, width=40)
-            entry.pack(pady=(0, 10))
-            entry.select_range(0, tk.END)
-            entry.focus()
-
-            button_frame = ttk.Frame(main_frame)
-            button_frame.pack()
-
-            def on_ok():
-                nonlocal result
-                result = entry_var.get().strip()
-                rule_dialog.destroy()
-
-            def on_cancel():
-                rule_dialog.destroy()
-
-            GButton(
-                button_frame,
-                text="OK",
-                command=on_ok,
-                width=80,
-                height=34,
-                **self.colors["buttons"]["primary"],
-            ).pack(side=tk.LEFT, padx=5)
-            GButton(
-                button_frame,
-                text="Cancel",
-                command=on_cancel,
-                width=80,
-                height=34,
-                **self.colors["buttons"]["default"],
-            ).pack(side=tk.LEFT)
-
-            rule_dialog.bind("<Return>", lambda e: on_ok())
-            rule_dialog.bind("<Escape>", lambda e: on_cancel())
-            entry.focus()
+            """Show a dialog to get a filter rule from the user."""
+            if not rule_input:
+                rule_dialog = tk.Toplevel(dialog)
+                rule_dialog.withdraw()
+                rule_dialog.transient(dialog)
+                rule_dialog.resizable(False, False)
+
+                entry_var = tk.StringVar()
+                done_var = tk.BooleanVar()
+
+                main_frame = ttk.Frame(rule_dialog, padding="20")
+                main_frame.pack()
+
+                prompt_label = ttk.Label(main_frame)
+                prompt_label.pack(anchor=tk.W, pady=(0, 5))
+                entry = ttk.Entry(main_frame, textvariable=entry_var, width=40)
+                entry.pack(pady=(0, 10))
+
+                button_frame = ttk.Frame(main_frame)
+                button_frame.pack()
+
+                def on_ok():
+                    rule_input["result"] = entry_var.get().strip()
+                    done_var.set(True)
+
+                def on_cancel():
+                    done_var.set(True)
+
+                self._primary_btn(
+                    button_frame,
+                    text="OK",
+                    command=on_ok,
+                    width=80,
+                    height=34,
+                ).pack(side=tk.LEFT, padx=5)
+                self._default_btn(
+                    button_frame,
+                    text="Cancel",
+                    command=on_cancel,
+                    width=80,
+                    height=34,
+                ).pack(side=tk.LEFT)
+
+                rule_dialog.bind("<Return>", lambda e: on_ok())
+                rule_dialog.bind("<Escape>", lambda e: on_cancel())
+                rule_dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+                rule_input.update(
+                    dialog=rule_dialog,
+                    prompt=prompt_label,
+                    entry=entry,
+                    entry_var=entry_var,
+                    done=done_var,
+                )
 
-            rule_dialog.wait_window()
-            return result
+            rule_input["result"] = None
+            rule_input["dialog"].title(title)
+            rule_input["prompt"].configure(text=prompt_text)
+            rule_input["entry_var"].set(initial_value)
+            rule_input["entry"].select_range(0, tk.END)
+            self._show_reusable_modal(
+                rule_input["dialog"], dialog, rule_input["done"], rule_input["entry"]
+            )
+            return rule_input["result"]
 
         def insert_rule():
             new_rule = _create_rule_input_dialog(
                 "Add Filter Rule", "Enter filter pattern:"
             )
             if new_rule and new_rule.strip():
-                temp_filters.append({"rule": new_rule.strip(), "active": True})
-                temp_filters.sort(key=lambda item: item["rule"])
+                bisect.insort(
+                    temp_filters,
+                    {"rule": new_rule.strip(), "active": True},
+                    key=_rule_key,
+                )
                 populate_tree()
 
         def edit_rule():
@@ -3250,8 +4214,9 @@ class GSynchro:
             )
 
             if edited_rule and edited_rule.strip():
-                temp_filters[index]["rule"] = edited_rule.strip()
-                temp_filters.sort(key=lambda item: item["rule"])
+                edited_item = temp_filters.pop(index)
+                edited_item["rule"] = edited_rule.strip()
+                bisect.insort(temp_filters, edited_item, key=_rule_key)
                 populate_tree()
 
         def select_all_rules():
@@ -3280,12 +4245,7 @@ class GSynchro:
             # both single-item and multi-item selection.
             selected_items = filter_tree.selection()
             if selected_items:
-                for item_id in selected_items:
-                    index = int(item_id)
-                    temp_filters[index]["active"] = not temp_filters[index].get(
-                        "active", True
-                    )
-            populate_tree()
+                toggle_rows([int(item_id) for item_id in selected_items])
 
         # Create context menu for filter tree.
         filter_context_menu = tk.Menu(filters_frame, tearoff=0)
@@ -3339,22 +4299,17 @@ class GSynchro:
             row=0, column=0, sticky=tk.E, padx=(0, 5), pady=5
         )
 
-        # Get available font families.
-        font_families = tkfont.families()
-
-        # Filter to monospace fonts (simplified check).
-        mono_fonts = sorted(
-            set(
-                f
-                for f in font_families
-                if any(
-                    mono in f.lower()
-                    for mono in ["mono", "consolas", "courier", "fixedsys", "terminal"]
-                )
-            )
-        )
-        if not mono_fonts:  # Fallback to all fonts.
-            mono_fonts = sorted(set(font_families))
+        # Installed fonts do not change while the app runs, so the monospace
+        # list is built on the first dialog open only.
+        if self._cached_mono_fonts is None:
+            font_families = tkfont.families()
+
+            # Filter to monospace fonts.
+            mono_fonts = sorted(set(filter(MONO_FONT_RE.search, font_families)))
+            if not mono_fonts:  # Fallback to all fonts.
+                mono_fonts = sorted(set(font_families))
+            self._cached_mono_fonts = mono_fonts
+        mono_fonts = self._cached_mono_fonts
 
         font_family_var = tk.StringVar(value=self.options["font_family"])
         font_family_combo = ttk.Combobox(
@@ -3393,7 +4348,6 @@ class GSynchro:
             # Store old values to check for changes.
             old_font_family = self.options["font_family"]
             old_font_size = self.options["font_size"]
-            old_filters = [dict(item) for item in self.filter_rules]
 
             # Get new values from dialog.
             new_font_family = font_family_var.get()
@@ -3404,7 +4358,7 @@ class GSynchro:
             font_changed = (  # noqa: B007
                 new_font_family != old_font_family or new_font_size != old_font_size
             )
-            other_options_changed = new_filters != old_filters
+            other_options_changed = _filters_fingerprint(new_filters) != old_filters
 
             # Update options dictionary with all new values.
             self.options.update(
@@ -3413,8 +4367,9 @@ class GSynchro:
                     "font_size": new_font_size,
                 }
             )
-            self.filter_rules = new_filters
-            self.filter_rules.sort(key=lambda item: item["rule"])
+            if other_options_changed:
+                # Kept sorted by rule as it is edited.
+                self._set_filter_rules(new_filters)
 
             # Apply font changes to styles and tags.
             self._update_tree_fonts()
@@ -3427,13 +4382,13 @@ class GSynchro:
             if other_options_changed:
                 self._log("Filters or other options changed, performing full refresh.")
                 if self.folder_a.get() and self.folder_b.get():
-                    self.compare_folders()
+                    self.compare_folders(use_scan_cache=True)
             elif font_changed:
                 self._log(
                     "Only font changed, adjusting column widths for new font size."
                 )
-                self._adjust_tree_column_widths(self.tree_a)
-                self._adjust_tree_column_widths(self.tree_b)
+                self._schedule_column_widths(self.tree_a)
+                self._schedule_column_widths(self.tree_b)
 
         def update_font_example(*args):
             """Update the font example when font family or size changes."""
@@ -3443,8 +4398,18 @@ class GSynchro:
                 font_example_label.configure(font=(font_family, font_size))
 
         # Bind font changes to update example.
-        font_family_var.trace("w", update_font_example)
-        font_size_var.trace("w", update_font_example)
+        font_traces = [
+            (var, var.trace_add("write", update_font_example))
+            for var in (font_family_var, font_size_var)
+        ]
+
+        def remove_font_traces(event: tk.Event):
+            # <Destroy> also reaches the dialog binding for every child.
+            if event.widget is dialog:
+                for var, trace_name in font_traces:
+                    var.trace_remove("write", trace_name)
+
+        dialog.bind("<Destroy>", remove_font_traces, add="+")
 
         # Initialize font example.
         update_font_example()
@@ -3461,35 +4426,35 @@ class GSynchro:
         button_row_frame = ttk.Frame(button_center_frame)
         button_row_frame.pack()
 
-        GButton(
+        self._primary_btn(
             button_row_frame,
             text="Apply",
             command=apply_options,
             width=100,
             height=34,
-            **self.colors["buttons"]["primary"],
         ).pack(side=tk.LEFT, padx=5)
 
-        GButton(
+        self._secondary_btn(
             button_row_frame,
             text="Reset",
             command=reset_options,
             width=100,
             height=34,
-            **self.colors["buttons"]["secondary"],
         ).pack(side=tk.LEFT, padx=5)
 
-        GButton(
+        self._secondary_btn(
             button_row_frame,
             text="Cancel",
             command=dialog.destroy,
             width=100,
             height=34,
-            **self.colors["buttons"]["secondary"],
         ).pack(side=tk.LEFT, padx=5)
 
     def _update_tree_fonts(self):
-        """Update tree fonts based on current options."""
+        """Update tree fonts based on current options.
+
+        The options are not saved here; callers persist them afterwards.
+        """
         font_family = self.options["font_family"]
         font_size = self.options["font_size"]
 
@@ -3507,32 +4472,6 @@ class GSynchro:
         if self.tree_b:
             self.tree_b.tag_configure("custom_font", font=(font_family, font_size))
 
-        # Save config.
-        self._save_config()
-
-    def _refresh_tree_views_after_font_change(self):
-        """Refresh tree views after font change - using a different approach."""
-        # We need to completely rebuild the trees.
-        if self.tree_a and self.folder_a.get():
-            # Store current folder.
-            folder = self.folder_a.get()
-            # Repopulate with current filters.
-            self._populate_single_panel(
-                "A", folder, active_rules=self._get_active_filters()
-            )
-
-        if self.tree_b and self.folder_b.get():
-            # Store current folder.
-            folder = self.folder_b.get()
-            # Repopulate with current filters.
-            self._populate_single_panel(
-                "B", folder, active_rules=self._get_active_filters()
-            )
-
-        # Run comparison again if needed.
-        if self.files_a and self.files_b:  # noqa: B007
-            self.compare_folders()
-
     def _create_filter_tree(self, parent: Union[tk.Toplevel, tk.Widget]) -> tuple:
         """Create tree view for filter dialog.
 
@@ -3563,17 +4502,106 @@ class GSynchro:
 
         return tree_frame, filter_tree
 
+    def _filter_tree_renderer(self, filter_tree: ttk.Treeview, filters: list):
+        """Return functions that keep a filter tree in line with its filters.
+
+        The render runs when Tk is next idle, so a burst of edits collapses
+        into a single update of the tree. Toggling rules only touches the
+        check cells of the toggled rows.
+
+        Args:
+            filter_tree: Filter tree view
+            filters: Filter rule dictionaries, in display order
+
+        Returns:
+            Tuple of (schedule_render, toggle_rows): schedule_render schedules
+            a render of the current filters, toggle_rows flips the active
+            state of the rules at the given indices
+        """
+        rendered = []
+        pending = []
+
+        def render():
+            pending.clear()
+            if filter_tree.winfo_exists():
+                self._render_filter_tree(filter_tree, filters, rendered)
+
+        def schedule_render():
+            if not pending:
+                pending.append(filter_tree.after_idle(render))
+
+        def toggle_rows(indices: list):
+            for index in indices:
+                item = filters[index]
+                item["active"] = not item["active"]
+                # A pending render picks the new state up by itself.
+                if not pending:
+                    row = (_CHECK_CHARS[bool(item["active"])], item["rule"])
+                    filter_tree.set(index, "check", row[0])
+                    rendered[index] = row
+
+        return schedule_render, toggle_rows
+
+    def _render_filter_tree(
+        self, filter_tree: ttk.Treeview, filters: list, rendered: list
+    ):
+        """Bring a filter tree in line with its filter list.
+
+        Rows are keyed by index. Only rows whose check mark or rule changed
+        are updated, and rows are added or removed at the end only, instead
+        of rebuilding the whole tree after every edit.
+
+        Args:
+            filter_tree: Filter tree view
+            filters: Filter rule dictionaries, in display order
+            rendered: (check_char, rule) rows currently shown; updated in place
+        """
+        rows = [(_CHECK_CHARS[bool(item["active"])], item["rule"]) for item in filters]
+
+        moved = []
+        for i, (row, shown) in enumerate(zip(rows, rendered)):  # noqa: B905
+            if row == shown:
+                continue
+            if row[1] == shown[1]:
+                filter_tree.set(i, "check", row[0])
+            else:
+                filter_tree.item(i, values=row)
+                moved.append(i)
+
+        if len(rendered) > len(rows):
+            filter_tree.delete(*range(len(rows), len(rendered)))
+        if len(rows) > len(rendered):
+            # Append the new rows with a single Tcl script.
+            filter_tree.tk.eval(
+                "\n".join(
+                    f"{filter_tree} insert {{}} end -id {i}"
+                    f" -values [list {check_char} {_tcl_quote(rule)}]"
+                    for i, (check_char, rule) in enumerate(
+                        rows[len(rendered) :], len(rendered)
+                    )
+                )
+            )
+
+        # A row that now shows another rule must not stay selected.
+        if moved:
+            filter_tree.selection_remove(*moved)
+        rendered[:] = rows
+
     def _get_active_filters(self) -> list:
         """Get active filter rule strings.
 
+        The list is built once per rule set and shared; callers must not
+        modify it.
+
         Returns:
             List of active filter rules
         """
-        return [
-            item["rule"]
-            for item in self.filter_rules
-            if isinstance(item, dict) and item.get("active", True)
-        ]
+        if self._active_filters_cache is None:
+            # _load_filter_rules guarantees dictionaries with an "active" key.
+            self._active_filters_cache = [
+                item["rule"] for item in self.filter_rules if item["active"]
+            ]
+        return self._active_filters_cache
 
     # ==========================================================================
     # TREE EVENT HANDLERS
@@ -3599,10 +4627,7 @@ class GSynchro:
                     current_state = self.sync_states.get(rel_path, False)
                     new_state = not current_state
                     self.sync_states[rel_path] = new_state
-                    char = CHECKED_CHAR if new_state else UNCHECKED_CHAR
-                    current_values = list(tree.item(item_id, "values"))
-                    current_values[0] = char
-                    tree.item(item_id, values=current_values)
+                    tree.set(item_id, "sync", _CHECK_CHARS[new_state])
 
     def _on_tree_right_click(self, event: tk.Event):
         """Show context menu on right-click."""
@@ -3611,6 +4636,10 @@ class GSynchro:
             return
         tree = cast(ttk.Treeview, widget)
 
+        # Check if tree has children - if not, don't show context menu.
+        if not tree.get_children():
+            return
+
         item_id = tree.identify_row(event.y)
 
         # Store context menu tree reference.
@@ -3646,62 +4675,42 @@ class GSynchro:
             rel_path = None
 
         # Enable/disable menu items based on context.
-        if item_info and item_info.get("type") == "file":
-            self.tree_context_menu.entryconfig("Open...", state="normal")
-            self.tree_context_menu.entryconfig("Open Folder", state="normal")
-        else:
-            self.tree_context_menu.entryconfig("Open...", state="disabled")
-            self.tree_context_menu.entryconfig(
-                "Open Folder", state="normal" if item_id else "disabled"
-            )
-
-        # Show/hide sync options based on the panel and whether an item is
-        # selected.
-        if item_id:
-            if tree is self.tree_a:
-                self.tree_context_menu.entryconfig("Sync  ▶", state="normal")
-                self.tree_context_menu.entryconfig("◀  Sync", state="disabled")
-            elif tree is self.tree_b:
-                self.tree_context_menu.entryconfig("Sync  ▶", state="disabled")
-                self.tree_context_menu.entryconfig("◀  Sync", state="normal")
-            else:
-                self.tree_context_menu.entryconfig("Sync  ▶", state="disabled")
-                self.tree_context_menu.entryconfig("◀  Sync", state="disabled")
-        else:
-            # No item selected - disable sync options.
-            self.tree_context_menu.entryconfig("Sync  ▶", state="disabled")
-            self.tree_context_menu.entryconfig("◀  Sync", state="disabled")
-
-        # Enable/disable Delete menu item based on whether an item is selected.
-        if item_id:
-            self.tree_context_menu.entryconfig("Delete", state="normal")
-        else:
-            self.tree_context_menu.entryconfig("Delete", state="disabled")
-
-        # Enable/disable Select All and Deselect All based on whether comparison
-        # has been performed.
-        if self.sync_states:
-            self.tree_context_menu.entryconfig("Select All", state="normal")
-            self.tree_context_menu.entryconfig("Deselect All", state="normal")
-        else:
-            self.tree_context_menu.entryconfig("Select All", state="disabled")
-            self.tree_context_menu.entryconfig("Deselect All", state="disabled")
-
-        # Enable/disable "Compare..." based on selections in both trees.
+        is_file = bool(item_info and item_info.get("type") == "file")
+        has_item = bool(item_id)
+        # "Compare..." needs a single selection in both trees.
         selected_a = self.tree_a.selection() if self.tree_a else ()
         selected_b = self.tree_b.selection() if self.tree_b else ()
-
-        # Check if tree has children - if not, don't show context menu.
-        if not tree.get_children():
-            return
+        self._set_context_menu_states(
+            {
+                "Open...": is_file,
+                "Open Folder": is_file or has_item,
+                # Sync options follow the panel of the selected item.
+                "Sync  ▶": has_item and tree is self.tree_a,
+                "◀  Sync": has_item and tree is self.tree_b,
+                "Delete": has_item,
+                # Select All and Deselect All need a comparison.
+                "Select All": bool(self.sync_states),
+                "Deselect All": bool(self.sync_states),
+                "Compare...": len(selected_a) == 1 and len(selected_b) == 1,
+            }
+        )
 
         # Post the menu at the cursor's location.
         self.tree_context_menu.tk_popup(event.x_root, event.y_root)  # noqa: B007
 
-        if len(selected_a) == 1 and len(selected_b) == 1:
-            self.tree_context_menu.entryconfig("Compare...", state="normal")
-        else:
-            self.tree_context_menu.entryconfig("Compare...", state="disabled")
+    def _set_context_menu_states(self, enabled: dict[str, bool]):
+        """Enable or disable tree context menu entries.
+
+        Only entries whose state differs from the last call are reconfigured.
+
+        Args:
+            enabled: Whether each entry, by label, is enabled
+        """
+        for label, is_enabled in enabled.items():
+            state = "normal" if is_enabled else "disabled"
+            if self._context_menu_states.get(label) != state:
+                self.tree_context_menu.entryconfig(label, state=state)
+                self._context_menu_states[label] = state
 
     def _on_tree_header_double_click(self, event: tk.Event):
         """Handle double-click on a treeview header to resize the column."""
@@ -3719,6 +4728,53 @@ class GSynchro:
             self._log(f"Adjusting width for column {column_id}")
             self._adjust_single_column_width(tree, column_id)
 
+    def _get_measure_font(self) -> tkfont.Font:
+        """Get the font for measuring tree contents, created once per setting.
+
+        Returns:
+            Font matching the current font options
+        """
+        key = (self.options["font_family"], self.options["font_size"])
+        font = self._measure_fonts.get(key)
+        if font is None:
+            # Only the current setting is kept.
+            self._measure_fonts.clear()
+            self._text_widths.clear()
+            font = self._measure_fonts[key] = tkfont.Font(family=key[0], size=key[1])
+
+            # Tk answers font queries faster for a font that a widget uses.
+            if self._measure_font_label is None:
+                self._measure_font_label = tk.Label(self.root, font=font)
+            else:
+                self._measure_font_label.configure(font=font)
+        return font
+
+    def _max_text_width(self, texts: Iterable[str]) -> int:
+        """Get the widest pixel width of some texts in the tree font.
+
+        Widths are remembered across calls, since file names, sizes and
+        statuses come back on every refresh of either tree.
+
+        Args:
+            texts: Distinct texts to measure
+
+        Returns:
+            Largest width in pixels, or 0 for no texts
+        """
+        measure = self._get_measure_font().measure
+        widths = self._text_widths
+        if len(widths) > TEXT_WIDTH_CACHE_SIZE:
+            widths.clear()
+
+        max_width = 0
+        for text in texts:
+            width = widths.get(text)
+            if width is None:
+                width = widths[text] = measure(text)
+            if width > max_width:
+                max_width = width
+        return max_width
+
     def _adjust_single_column_width(self, tree: ttk.Treeview, column_id: str):
         """Adjust the width of a single column to fit its content.
 
@@ -3730,29 +4786,25 @@ class GSynchro:
             return
 
         try:
-            font_family = self.options["font_family"]
-            font_size = self.options["font_size"]
-            font = tkfont.Font(family=font_family, size=font_size)
-
-            # Start with the width of the header text.
-            max_width = font.measure(tree.heading(column_id, "text"))
-
-            def find_max_width_recursive(item_id=""):
-                """Recursively find the maximum content width in the column."""
-                nonlocal max_width
-                for child_id in tree.get_children(item_id):
-                    if column_id == "#0":  # The 'Name' column.
-                        cell_value = tree.item(child_id, "text")  # noqa: B007
-                    else:
-                        cell_value = tree.set(child_id, column_id)
-
-                    if isinstance(cell_value, str):
-                        max_width = max(max_width, font.measure(cell_value))
+            # Start with the header text; sizes and statuses repeat a lot, so
+            # each distinct value is measured only once.
+            cell_values = {tree.heading(column_id, "text")}
+
+            # Visit every item once, without recursion.
+            stack = list(tree.get_children(""))
+            while stack:
+                child_id = stack.pop()
+                if column_id == "#0":  # The 'Name' column.
+                    cell_value = tree.item(child_id, "text")
+                else:
+                    cell_value = tree.set(child_id, column_id)
 
-                    find_max_width_recursive(child_id)
+                if isinstance(cell_value, str):
+                    cell_values.add(cell_value)
 
-            find_max_width_recursive()
+                stack.extend(tree.get_children(child_id))
 
+            max_width = self._max_text_width(cell_values)
             tree.column(column_id, width=max_width + 20)
         except Exception as e:
             self._log(f"Could not adjust column width for {column_id}: {e}")
@@ -3826,6 +4878,7 @@ class GSynchro:
                     )
 
                 files_to_copy = []
+                selected_dirs = set()
                 for rel_path in rel_paths:
                     source_item = source_files_dict.get(rel_path)
                     if not source_item:
@@ -3840,16 +4893,23 @@ class GSynchro:
                     if source_item.get("type") == "file":
                         files_to_copy.append(rel_path)
                     else:
-                        # Directory: include all child files.
-                        dir_prefix = rel_path.rstrip(os.sep).replace(os.sep, "/") + "/"
-                        for p, info in source_files_dict.items():
-                            if info.get("type") != "file":
-                                continue
-                            if p.replace(os.sep, "/").startswith(dir_prefix):
-                                files_to_copy.append(p)
-
-                # Remove duplicates.
-                files_to_copy = sorted(list(set(files_to_copy)))
+                        selected_dirs.add(rel_path.rstrip("/"))
+
+                # Directories: include all child files, in one pass over the
+                # files however many directories were selected.
+                if selected_dirs:
+                    for p, info in source_files_dict.items():
+                        if info.get("type") != "file":
+                            continue
+                        parent = info["parent"]
+                        while parent and parent not in selected_dirs:
+                            parent = parent.rpartition("/")[0]
+                        if parent:
+                            files_to_copy.append(p)
+
+                # Remove duplicates; transfers run in parallel, so order is
+                # irrelevant and no sort is needed.
+                files_to_copy = list(dict.fromkeys(files_to_copy))
                 target_files_dict = (
                     self.files_b if direction == "a_to_b" else self.files_a
                 )
@@ -3883,7 +4943,7 @@ class GSynchro:
 
                 self._log("Successfully synced items. Refreshing view...")
 
-                self.root.after(0, self.compare_folders)
+                self._schedule_compare()
 
             except Exception as e:
                 self._log(f"Error syncing items: {e}")
@@ -3893,46 +4953,6 @@ class GSynchro:
 
         threading.Thread(target=sync_thread, daemon=True).start()
 
-    def _refresh_tree_after_sync(self, direction: str, synced_item_rel_path: str):
-        """Refresh the treeview after a single item has been synchronized.
-
-        Args:
-            direction: Sync direction
-            synced_item_rel_path: Path of the synchronized item
-        """
-        self._log(f"Updating UI for synced item: {synced_item_rel_path}")
-
-        # Determine source and destination data.
-        rules = self._get_active_filters()
-        if direction == "a_to_b":
-            source_files, dest_files = self.files_a, self.files_b
-            dest_tree = self.tree_b
-        else:
-            source_files, dest_files = self.files_b, self.files_a
-            dest_tree = self.tree_a
-
-        source_item_info = source_files.get(synced_item_rel_path)
-        if not source_item_info:
-            self._log(
-                f"Could not find source info for {synced_item_rel_path}, performing full refresh."
-            )
-            self.root.after(0, self.compare_folders)
-            return
-
-        # Update the destination file's metadata to match the source.
-        dest_files[synced_item_rel_path] = source_item_info.copy()
-
-        # Rebuild and repopulate the destination tree.
-        tree_structure = self._build_tree_structure(dest_files)
-        if dest_tree:
-            self._batch_populate_tree(dest_tree, tree_structure, rules)
-
-        # After sync, the item is no longer selected for sync.
-        self.sync_states[synced_item_rel_path] = False
-
-        # Find the item in both trees and update its status.
-        self.root.after(0, self.compare_folders)
-
     def _select_all(self):
         """Select all different/new items."""
         # Use stored context menu tree if available, otherwise fall back to
@@ -3944,29 +4964,23 @@ class GSynchro:
         if not isinstance(tree, ttk.Treeview) or tree not in (self.tree_a, self.tree_b):
             return
 
-        diff_statuses = {
-            "Different",
-            "Only in A",
-            "Only in B",
-        }
-
-        def traverse_and_select(item_id=""):
-            for child_id in tree.get_children(item_id):
-                status_values = tree.item(child_id, "values")
-                status = status_values[3] if len(status_values) > 3 else ""
-                if status in diff_statuses:
-                    rel_path = self._get_relative_path(tree, child_id)
-                    if rel_path is not None:
-                        self.sync_states[rel_path] = True
-                        current_values = list(status_values)
-                        current_values[0] = CHECKED_CHAR
-                        tree.item(child_id, values=tuple(current_values))
-
-                # Recurse into children.
-                if tree.get_children(child_id):
-                    traverse_and_select(child_id)
-
-        traverse_and_select()
+        # Every status has its own color tag, so the items to check come
+        # straight from Tk instead of from reading each item's status.
+        checked = [
+            item_id
+            for _, color in (
+                STATUS_DIFFERENT,
+                STATUS_DIFFERENT_FOLDER,
+                STATUS_ONLY_A,
+                STATUS_ONLY_B,
+            )
+            for item_id in tree.tag_has(color)
+        ]
+        for item_id in checked:
+            rel_path = self._get_relative_path(tree, item_id)
+            if rel_path is not None:
+                self.sync_states[rel_path] = True
+        self._set_sync_cells(tree, checked, CHECKED_CHAR)
 
     def _deselect_all(self):
         """Deselect all items in the tree."""
@@ -3979,22 +4993,35 @@ class GSynchro:
         if not isinstance(tree, ttk.Treeview) or tree not in (self.tree_a, self.tree_b):
             return
 
-        def traverse_and_deselect(item_id=""):
-            for child_id in tree.get_children(item_id):
-                rel_path = self._get_relative_path(tree, child_id)
-                if rel_path is not None:
-                    # Check if item is in sync_states.
-                    if rel_path in self.sync_states:
-                        self.sync_states[rel_path] = False
-                    current_values = list(tree.item(child_id, "values"))
-                    current_values[0] = UNCHECKED_CHAR
-                    tree.item(child_id, values=tuple(current_values))
+        # Paths come from one walk of the tree instead of one walk up to the
+        # root per item.
+        tree_map = self._build_tree_map(tree)
+        for rel_path in tree_map:
+            # Check if item is in sync_states.
+            if rel_path in self.sync_states:
+                self.sync_states[rel_path] = False
+        self._set_sync_cells(tree, tree_map.values(), UNCHECKED_CHAR)
+
+    def _set_sync_cells(
+        self, tree: ttk.Treeview, item_ids: Iterable[str], check_char: str
+    ):
+        """Set the sync check mark of many tree items at once.
 
-                # Recurse into children.
-                if tree.get_children(child_id):
-                    traverse_and_deselect(child_id)
+        Only the sync cell is written, with a single Tcl script instead of
+        one call per item.
 
-        traverse_and_deselect()
+        Args:
+            tree: Treeview widget
+            item_ids: Items to update
+            check_char: Check mark to show
+        """
+        check_char = _tcl_quote(check_char)
+        script = "\n".join(
+            f"{tree} set {_tcl_quote(item_id)} sync {check_char}"
+            for item_id in item_ids
+        )
+        if script:
+            tree.tk.eval(script)
 
     def _compare_selected_files(self):
         """Launch g_compare.py with the two selected files."""
@@ -4053,6 +5080,44 @@ class GSynchro:
         finally:
             self._clear_context_menu_state()
 
+    def _open_with_default_app(self, path: str, kind: str):
+        """Open a path with the desktop's default application.
+
+        xdg-open may not return until the application has started, so it is
+        waited on in a background thread instead of on the UI thread.
+
+        Args:
+            path: Local path to open
+            kind: What the path is ("file" or "folder"), for error messages
+        """
+        if sys.platform == "win32":
+            os.startfile(path)
+            return
+        if sys.platform == "darwin":  # macOS
+            subprocess.Popen(["open", path])
+            return
+
+        # Linux and other Unix-like systems.
+        process = subprocess.Popen(
+            ["xdg-open", path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+        def wait_for_xdg_open():
+            _, stderr = process.communicate()
+            if process.returncode != 0:
+                error_message = stderr.decode().strip()
+                self._log(f"xdg-open error: {error_message}")
+                self.root.after(
+                    0,
+                    lambda: messagebox.showwarning(
+                        "Warning", f"Could not open {kind}: {error_message}"
+                    ),
+                )
+
+        threading.Thread(target=wait_for_xdg_open, daemon=True).start()
+
     def _open_selected_item(self):
         """Open selected file with default app."""
         tree = self._context_menu_tree
@@ -4072,23 +5137,7 @@ class GSynchro:
                 return
 
             self._log(f"Opening file: {local_path}")
-            if sys.platform == "win32":
-                os.startfile(local_path)
-            elif sys.platform == "darwin":  # macOS
-                subprocess.Popen(["open", local_path])
-            else:  # Linux and other Unix-like systems.
-                process = subprocess.Popen(
-                    ["xdg-open", local_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-                stdout, stderr = process.communicate()
-                if process.returncode != 0:
-                    error_message = stderr.decode().strip()
-                    self._log(f"xdg-open error: {error_message}")
-                    messagebox.showwarning(
-                        "Warning", f"Could not open file: {error_message}"
-                    )
+            self._open_with_default_app(local_path, "file")
 
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file: {e}")
@@ -4128,23 +5177,7 @@ class GSynchro:
                 return
 
             self._log(f"Opening folder: {folder_path}")
-            if sys.platform == "win32":
-                os.startfile(folder_path)
-            elif sys.platform == "darwin":  # macOS
-                subprocess.Popen(["open", folder_path])
-            else:  # Linux and other Unix-like systems.
-                process = subprocess.Popen(
-                    ["xdg-open", folder_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                )
-                stdout, stderr = process.communicate()
-                if process.returncode != 0:
-                    error_message = stderr.decode().strip()
-                    self._log(f"xdg-open error: {error_message}")
-                    messagebox.showwarning(
-                        "Warning", f"Could not open folder: {error_message}"
-                    )
+            self._open_with_default_app(folder_path, "folder")
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
         finally:
@@ -4190,24 +5223,23 @@ class GSynchro:
                             raise ConnectionError(
                                 f"Could not connect to Panel {panel} for deletion."
                             )
-                        is_dir = False  # noqa: B007
-                        if item_info:
-                            is_dir = item_info.get("type") == "dir"
-                        else:
-                            # Fallback: check remote system.
-                            stdin, stdout, stderr = ssh_client.exec_command(
-                                f"if [ -d {_posix_quote(full_path)} ]; then echo 'dir'; fi"
-                            )
-                            if stdout.read().decode().strip() == "dir":
-                                is_dir = True
+                        # An item of unknown type is removed with rm -rf too,
+                        # which handles files and folders alike, instead of
+                        # first asking the remote side what it is.
+                        is_file = bool(item_info) and item_info.get("type") != "dir"
                         command = (
-                            f"rm -rf {_posix_quote(full_path)}"
-                            if is_dir
-                            else f"rm {_posix_quote(full_path)}"
+                            f"rm {_posix_quote(full_path)}"
+                            if is_file
+                            else f"rm -rf {_posix_quote(full_path)}"
                         )
                         stdin, stdout, stderr = ssh_client.exec_command(command)
-                        error = stderr.read().decode()
-                        if error:
+                        # Drain stderr before waiting for the exit status: a
+                        # flood of errors from rm -rf could otherwise fill the
+                        # channel window and block both sides.
+                        error = stderr.read().decode().strip()
+                        exit_status = stdout.channel.recv_exit_status()
+                        self._invalidate_remote_caches()
+                        if exit_status != 0:
                             raise Exception(error)
                 else:
                     # Local deletion.
@@ -4280,29 +5312,13 @@ class GSynchro:
         if not path:
             return False
 
-        # Check for common temporary directory patterns.
-        temp_patterns = [
-            "/tmp/",
-            "\\tmp\\",
-            "/temp/",
-            "\\temp\\",
-            tempfile.gettempdir(),
-        ]
-
+        # Check for common temporary directory patterns, and for
+        # tempfile.NamedTemporaryFile names.
         path_normalized = os.path.normpath(path)
-        for pattern in temp_patterns:
-            if pattern in path_normalized:
-                return True
-
-        # Check for tempfile.NamedTemporaryFile patterns.
-        if "tmp" in path_normalized and (
-            path_normalized.startswith("/tmp/")
-            or path_normalized.startswith("\\tmp\\")
+        return bool(
+            TEMP_PATH_RE.search(path_normalized)
             or "tmp" in os.path.basename(path_normalized)
-        ):
-            return True
-
-        return False
+        )
 
     def _update_panel_history(
         self, panel_name: str, folder_var: tk.StringVar, new_path: str
@@ -4349,6 +5365,10 @@ class GSynchro:
         if tree is None or item_id is None:
             return None
 
+        rel_path = self._tree_item_paths.get(str(tree), {}).get(item_id)
+        if rel_path is not None:
+            return rel_path
+
         path_parts = []
         while item_id:
             text = tree.item(item_id, "text")
@@ -4356,7 +5376,7 @@ class GSynchro:
             item_id = tree.parent(item_id)
 
         if path_parts:
-            return os.path.join(*path_parts)
+            return "/".join(path_parts)
         return None
 
     def _get_full_path_for_item(
@@ -4425,8 +5445,16 @@ class GSynchro:
                     with tempfile.NamedTemporaryFile(
                         delete=False, suffix=os.path.basename(rel_path)
                     ) as tmp:
-                        with SCPClient(transport) as scp:
-                            scp.get(full_path, tmp.name)
+                        # SFTP pipelines its reads (paramiko prefetches the
+                        # file); SCP is kept for servers without SFTP.
+                        try:
+                            sftp = ssh_client.open_sftp()
+                        except paramiko.SSHException:
+                            with SCPClient(transport) as scp:
+                                scp.get(full_path, tmp.name)
+                        else:
+                            with sftp:
+                                sftp.get(full_path, tmp.name)
                         self.temp_files_to_clean.append(tmp.name)
                         return tmp.name
             except Exception as e:
@@ -4434,6 +5462,25 @@ class GSynchro:
                 return None
         return full_path
 
+    def _schedule_column_widths(self, tree: Optional[ttk.Treeview]):
+        """Adjust a tree's column widths once Tk is idle.
+
+        The new rows are shown before they are measured, and requests made
+        before the adjustment runs share it.
+
+        Args:
+            tree: Treeview widget to adjust
+        """
+        if tree is None or str(tree) in self._column_widths_pending:
+            return
+        self._column_widths_pending.add(str(tree))
+
+        def adjust():
+            self._column_widths_pending.discard(str(tree))
+            self._adjust_tree_column_widths(tree)
+
+        self.root.after_idle(adjust)
+
     def _adjust_tree_column_widths(self, tree: Optional[ttk.Treeview]):
         """Adjust column widths to fit content.
 
@@ -4444,37 +5491,32 @@ class GSynchro:
             return
 
         try:
-            # Ensure we measure with the same font.
-            font_family = self.options["font_family"]
-            font_size = self.options["font_size"]
-            font = tkfont.Font(family=font_family, size=font_size)
+            # Collect the distinct values of each column, headers included,
+            # so that each one is measured only once.
+            columns = tuple(tree["columns"])
+            col_values = {col: {tree.heading(col, "text")} for col in columns + ("#0",)}
+
+            # Visit every item once, without recursion; tree.item() returns
+            # the name and all data columns of an item in one call.
+            stack = list(tree.get_children(""))
+            while stack:
+                child_id = stack.pop()
+                info = tree.item(child_id)
+
+                # Check the 'Name' column (#0).
+                col_values["#0"].add(str(info["text"]))
+
+                # Check other data columns.
+                for col, cell_value in zip(columns, info["values"]):  # noqa: B905
+                    if isinstance(cell_value, str):
+                        col_values[col].add(cell_value)
+
+                stack.extend(tree.get_children(child_id))
 
-            # Create a dictionary to hold the max width for each column.
             col_widths = {
-                col: font.measure(tree.heading(col, "text"))
-                for col in list(tree["columns"]) + ["#0"]
+                col: self._max_text_width(values) for col, values in col_values.items()
             }
 
-            def find_max_widths_recursive(item_id=""):
-                """Recursively traverse the tree to find the max width for each column."""
-                for child_id in tree.get_children(item_id):
-                    # Check the 'Name' column (#0).
-                    text = tree.item(child_id, "text")
-                    col_widths["#0"] = max(col_widths["#0"], font.measure(text))
-
-                    # Check other data columns.
-                    for col in tree["columns"]:
-                        cell_value = tree.set(child_id, col)
-                        if isinstance(cell_value, str):
-                            col_widths[col] = max(
-                                col_widths[col], font.measure(cell_value)
-                            )
-
-                    # Recurse.
-                    find_max_widths_recursive(child_id)
-
-            find_max_widths_recursive()
-
             # Apply the calculated widths with some padding.
             for col, width in col_widths.items():
                 tree.column(col, width=width + 20, minwidth=40)
@@ -4487,19 +5529,29 @@ class GSynchro:
     def _update_status(self, panel: str, files: dict):
         """Update the status bar text.
 
+        The totals are computed on the calling thread; from a worker thread
+        only the finished text is handed to the Tk loop.
+
         Args:
             panel: Panel identifier ("A" or "B")
             files: Dictionary of files in the panel
         """
-        num_dirs = sum(1 for f in files.values() if f.get("type") == "dir")
-        num_files = sum(1 for f in files.values() if f.get("type") == "file")
-        total_size = sum(f.get("size", 0) for f in files.values())
+        # Count and sum in a single pass over the entries.
+        num_dirs = num_files = total_size = 0
+        for f in files.values():
+            file_type = f.get("type")
+            if file_type == "dir":
+                num_dirs += 1
+            elif file_type == "file":
+                num_files += 1
+                total_size += f.get("size", 0)
         status_text = f"Folders: {num_dirs}, Files: {num_files}, Size: {self._format_size(total_size)}"
 
-        if panel == "A":
-            self.status_a.set(status_text)
+        status_var = self.status_a if panel == "A" else self.status_b
+        if threading.current_thread() is threading.main_thread():
+            status_var.set(status_text)
         else:
-            self.status_b.set(status_text)
+            self.root.after(0, status_var.set, status_text)
 
     def _start_progress(self, panel=None, max_value=0, text=""):
         """Show the progress bar.
@@ -4526,22 +5578,54 @@ class GSynchro:
         if max_value > 0:
             self.progress_bar.config(mode="determinate", maximum=max_value, value=0)
             status_var.set(text)
+            # Steps queued by workers that got here first are kept; the
+            # counter is cleared by _stop_progress.
+            if self._progress_poll_id is None:
+                self._progress_poll_id = self.root.after(
+                    PROGRESS_POLL_MS, self._drain_progress
+                )
         else:
             self.progress_bar.config(mode="indeterminate")
             self.progress_bar.start(10)
             status_var.set("Scanning...")
 
     def _update_progress(self, step=1):
-        """Update the progress bar.
+        """Advance the progress bar directly; main thread only.
+
+        Worker threads use _queue_progress instead.
+
+        Args:
+            step: Step size to increment
+        """
+        self.progress_bar.step(step)
+
+    def _queue_progress(self, step=1):
+        """Count progress steps from any thread.
+
+        The steps are applied by _drain_progress on the Tk loop, so worker
+        threads never queue a Tk event per item.
 
         Args:
             step: Step size to increment
         """
         with self._progress_lock:
+            self._progress_pending += step
+
+    def _drain_progress(self):
+        """Apply the queued progress steps, then poll again."""
+        with self._progress_lock:
+            step, self._progress_pending = self._progress_pending, 0
+        if step:
             self.progress_bar.step(step)
+        self._progress_poll_id = self.root.after(PROGRESS_POLL_MS, self._drain_progress)
 
     def _stop_progress(self):
         """Hide the progress bar."""
+        if self._progress_poll_id is not None:
+            self.root.after_cancel(self._progress_poll_id)
+            self._progress_poll_id = None
+        with self._progress_lock:
+            self._progress_pending = 0
         self.progress_bar.stop()
         self.progress_bar.grid_remove()
         if self.status_label_a:
@@ -4568,11 +5652,7 @@ class GSynchro:
         Returns:
             Formatted size string
         """
-        for unit in [" B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"  # Beyond TB, it's Petabytes
+        return _format_size_cached(size_bytes)
 
     def _format_time(self, timestamp: float) -> str:
         """Format timestamp to a date string.
@@ -4583,7 +5663,35 @@ class GSynchro:
         Returns:
             Formatted date string
         """
-        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        # Only whole seconds are shown, so quantize before the cache lookup.
+        return _format_time_cached(int(timestamp))
+
+    def _show_reusable_modal(
+        self,
+        modal: tk.Toplevel,
+        parent: Union[tk.Widget, tk.Toplevel],
+        done_var: tk.BooleanVar,
+        focus_widget: Optional[tk.Widget] = None,
+    ):
+        """Show a hidden dialog modally and hide it again once it is done.
+
+        The dialog is reused instead of being destroyed, so its widgets are
+        built only once.
+
+        Args:
+            modal: Withdrawn dialog to show
+            parent: Parent window to center on
+            done_var: Variable the dialog sets when it is finished
+            focus_widget: Widget to focus when the dialog is shown
+        """
+        modal.deiconify()
+        self._center_dialog(modal, relative_to=parent)
+        modal.grab_set()
+        if focus_widget is not None:
+            focus_widget.focus_set()
+        modal.wait_variable(done_var)
+        modal.grab_release()
+        modal.withdraw()
 
     def _center_dialog(
         self,
@@ -4604,8 +5712,13 @@ class GSynchro:
         parent_width = parent.winfo_width()
         parent_height = parent.winfo_height()
 
-        dialog_width = dialog.winfo_width()
-        dialog_height = dialog.winfo_height()
+        # An unmapped dialog has no size yet, but its requested size is known.
+        if dialog.winfo_ismapped():
+            dialog_width = dialog.winfo_width()
+            dialog_height = dialog.winfo_height()
+        else:
+            dialog_width = dialog.winfo_reqwidth()
+            dialog_height = dialog.winfo_reqheight()
 
         x = parent_x + (parent_width // 2) - (dialog_width // 2)
         y = parent_y + (parent_height // 2) - (dialog_height // 2)
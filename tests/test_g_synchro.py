@@ -2,7 +2,9 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 import tkinter as tk
+import types
 from pathlib import Path
 
 import pytest
@@ -173,6 +175,141 @@ class TestComparePanels:
         actual_statuses = _run_comparison(app, panel_a_dir, panel_b_dir)
         assert actual_statuses.get("conflict") == ("Conflict", "black")
 
+    def test_trusted_mtime_skips_content_check(self, comparison_test_environment):
+        """Test that equal size and mtime settle the comparison only when trusted."""
+        cprint(f"\n--- {self.test_trusted_mtime_skips_content_check.__doc__}", "yellow")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        os.utime(panel_a_dir / "different.txt", (0, 1_000_000_000))
+        os.utime(panel_b_dir / "different.txt", (0, 1_000_000_000))
+        file_a = app._scan_local(panel_a_dir)["different.txt"]
+        file_b = app._scan_local(panel_b_dir)["different.txt"]
+
+        assert app.comparer._compare_files(
+            file_a, file_b, False, False, None, None
+        ) == ("Different", "orange")
+        assert app.comparer._compare_files(
+            file_a, file_b, False, False, None, None, trust_mtime=True
+        ) == ("Identical", "green")
+
+    def test_hash_files_matches_content(self, comparison_test_environment):
+        """Test that file digests match for identical content only."""
+        cprint(f"\n--- {self.test_hash_files_matches_content.__doc__}", "yellow")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        files_a = app._scan_local(panel_a_dir)
+        files_b = app._scan_local(panel_b_dir)
+        rel_paths = ["identical.txt", "different.txt"]
+
+        hashes_a = app.comparer._hash_files(rel_paths, files_a, False, {})
+        hashes_b = app.comparer._hash_files(rel_paths, files_b, False, {})
+
+        assert hashes_a["identical.txt"] == hashes_b["identical.txt"]
+        assert hashes_a["different.txt"] != hashes_b["different.txt"]
+
+    def test_nested_scan_keys_and_parents(self, comparison_test_environment):
+        """Test that a local scan keys nested entries by "/"-separated paths."""
+        cprint(f"\n--- {self.test_nested_scan_keys_and_parents.__doc__}", "yellow")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        files_a = app._scan_local(panel_a_dir)
+
+        assert set(files_a) == {
+            "identical.txt",
+            "different.txt",
+            "only_in_a.txt",
+            "subdir",
+            "subdir/subfile.txt",
+            "shared_dir",
+            "shared_dir/a_only.txt",
+            "deep",
+            "deep/a",
+            "deep/a/deep_file.txt",
+            "conflict",
+        }
+        assert files_a["deep"]["parent"] == ""
+        assert files_a["deep/a"]["parent"] == "deep"
+        assert files_a["deep/a/deep_file.txt"]["parent"] == "deep/a"
+        assert files_a["deep/a/deep_file.txt"]["full_path"] == str(
+            panel_a_dir / "deep" / "a" / "deep_file.txt"
+        )
+        assert files_a["deep/a"]["type"] == "dir"
+
+    def test_nested_dirty_folders_and_files_to_copy(self, comparison_test_environment):
+        """Test dirty folder propagation and sync selection on nested paths."""
+        cprint(
+            f"\n--- {self.test_nested_dirty_folders_and_files_to_copy.__doc__}",
+            "yellow",
+        )
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        app.files_a = app._scan_local(panel_a_dir)
+        app.files_b = app._scan_local(panel_b_dir)
+
+        item_statuses, stats, dirty_folders = app._calculate_item_statuses_parallel(
+            set(app.files_a) | set(app.files_b),
+            app.files_a,
+            app.files_b,
+            False,
+            False,
+            {},
+            {},
+        )
+        assert dirty_folders == {"", "deep", "deep/a", "shared_dir", "subdir"}
+
+        app._propagate_dirty_folders(item_statuses, dirty_folders)
+        assert item_statuses["deep/a/deep_file.txt"] == ("Only in A", "blue")
+        assert item_statuses["deep/a"] == ("Only in A", "blue")
+        assert item_statuses["deep"] == ("Only in A", "blue")
+        assert item_statuses["shared_dir"] == ("Different", "magenta")
+        assert item_statuses["."] == ("Different", "magenta")
+
+        assert app._get_files_to_copy(app.files_a) == [
+            "deep/a/deep_file.txt",
+            "different.txt",
+            "only_in_a.txt",
+            "shared_dir/a_only.txt",
+            "subdir/subfile.txt",
+        ]
+        assert app._get_files_to_copy(app.files_b) == [
+            "conflict",
+            "different.txt",
+            "only_in_b.txt",
+            "shared_dir/b_only.txt",
+        ]
+
+    def test_name_and_path_rules_on_local_scan(self, comparison_test_environment):
+        """Test that name and path rules exclude the expected scanned entries."""
+        cprint(f"\n--- {self.test_name_and_path_rules_on_local_scan.__doc__}", "yellow")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        rules = ["a", "shared_dir/a_*", "subfile.txt", "*.md"]
+        (panel_a_dir / "subdir" / "notes.md").write_text("notes")
+        scanned = set(app._scan_local(panel_a_dir, rules=rules))
+
+        # A folder name rule matches at any depth and drops the contents.
+        assert "deep" in scanned
+        assert "deep/a" not in scanned
+        assert "deep/a/deep_file.txt" not in scanned
+        # A path rule matches the relative path only.
+        assert "shared_dir" in scanned
+        assert "shared_dir/a_only.txt" not in scanned
+        # File rules match the relative path, where "*" also spans folders.
+        assert "subdir/subfile.txt" in scanned
+        assert "subdir/notes.md" not in scanned
+        assert "identical.txt" in scanned
+
+    def test_folder_rule_on_local_scan(self, comparison_test_environment):
+        """Test that a trailing "/" rule excludes folders but not same-named files."""
+        cprint(f"\n--- {self.test_folder_rule_on_local_scan.__doc__}", "yellow")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+        rules = ["conflict/", "sub*/"]
+        scanned_a = set(app._scan_local(panel_a_dir, rules=rules))
+        scanned_b = set(app._scan_local(panel_b_dir, rules=rules))
+
+        assert "conflict" not in scanned_a
+        assert "conflict" in scanned_b
+        assert "subdir" not in scanned_a
+        assert "subdir/subfile.txt" not in scanned_a
+        assert "subdir_b" not in scanned_b
+        assert "shared_dir" in scanned_a
+        assert "shared_dir/b_only.txt" in scanned_b
+
 
 class TestSync:
     """Test suite for synchronization functionality."""
@@ -563,6 +700,57 @@ class TestFiltering:
         assert "my_dir_folder/nested.txt" not in actual_paths
         assert "file.txt" in actual_paths  # Ensure other files are still present
 
+    def test_apply_rescans_after_compare(
+        self, comparison_test_environment, monkeypatch
+    ):
+        """Test that a repeated Apply rescans once a Compare has redrawn the trees."""
+        cprint(f"\n--- {self.test_apply_rescans_after_compare.__doc__}", "cyan")
+        app, panel_a_dir, panel_b_dir = comparison_test_environment
+
+        # Run the comparison thread inline, so each step finishes in order.
+        class InlineThread:
+            def __init__(self, target, daemon=None):
+                self.target = target
+
+            def start(self):
+                self.target()
+
+        inline_threading = types.SimpleNamespace(**vars(threading))
+        inline_threading.Thread = InlineThread
+        monkeypatch.setattr("g_synchro.threading", inline_threading)
+
+        # Panel scans only report back; the comparison rescans both panels.
+        scanned_panels = []
+
+        def populate(panel, folder, active_rules=None, on_done=None, **kwargs):
+            scanned_panels.append(panel)
+            on_done(True)
+
+        monkeypatch.setattr(app, "_populate_single_panel", populate)
+        rules = ["*.txt"]
+
+        app._apply_filters(rules)
+        app.root.update()
+        assert scanned_panels == ["A", "B"]
+        # The comparison was drawn with the applied rules.
+        assert "identical.txt" not in app.files_a
+        assert "subdir" in app.files_a
+
+        # Nothing changed, so the same rules are not applied again.
+        app._apply_filters(rules)
+        app.root.update()
+        assert scanned_panels == ["A", "B"]
+
+        # An explicit Compare redraws the trees with the saved rules.
+        app.compare_folders()
+        app.root.update()
+        assert "identical.txt" in app.files_a
+
+        app._apply_filters(rules)
+        app.root.update()
+        assert scanned_panels == ["A", "B", "A", "B"]
+        assert "identical.txt" not in app.files_a
+
 
 class TestSymbolicLinks:
     """Test suite for symbolic link handling."""